@@ -1,11 +1,14 @@
 import asyncio
-from datetime import datetime, timedelta
+from functools import partial
 import logging
+import time
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as config_validation
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceEntry
@@ -13,18 +16,44 @@ from homeassistant.helpers.entity_registry import (
     async_entries_for_device,
     async_get as async_get_entity_registry,
 )
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    COMMAND_RESULT_FAILED,
+    COMMAND_RESULT_SENT,
+    COMMAND_RESULT_SKIPPED,
+    COMMAND_RESULT_TIMED_OUT,
+    CONFIRMATION_TIMEOUT_SECONDS,
+    CONFIG_ACCOUNT_ID_KEY,
+    CONFIG_DAILY_API_BUDGET_KEY,
     CONFIG_DARK_HOURS_END,
     CONFIG_DARK_HOURS_START,
     CONFIG_EXPERIMENTAL_KEY,
+    CONFIG_GEOCODE_MIN_DISTANCE_KEY,
+    CONFIG_POLL_BACKOFF_FACTOR_KEY,
+    CONFIG_PAYLOAD_ALLOW_LIST_KEY,
+    CONFIG_POLL_MIN_INTERVAL_KEY,
+    CONFIG_QUIET_WINDOWS_KEY,
     CONFIG_SCAN_INTERVAL_KEY,
+    CONFIG_SHADOW_SCAN_INTERVAL_KEY,
     CONFIG_VIN_KEY,
-    COORDINATOR,
+    CONFIG_VINS_KEY,
+    COORDINATORS,
+    DATA_ADDRESS_KEY,
     DATA_EXPECTED_STATE,
+    DATA_HTTP_CLIENT,
+    DATA_FORCED_REFRESHES,
     DATA_IS_FORCE_UPDATE,
-    DATA_STORED_DATA,
+    DATA_POLL_SCHEDULERS,
+    DATA_RECORD_KEY,
+    DATA_SHADOW_KEY,
+    DATA_SNAPSHOT_HISTORY,
+    DATA_SNAPSHOT_STORE,
+    DATA_POLL_SEMAPHORE,
+    DATA_QUIET_SCHEDULE,
+    DATA_TOKEN_REFRESH,
+    DATA_VEHICLES,
     DOMAIN,
     EXPECTED_STATE_CLIMATE_OFF,
     EXPECTED_STATE_CLIMATE_ON,
@@ -32,6 +61,7 @@ from .const import (
     EXPECTED_STATE_ENGINE_ON,
     EXPECTED_STATE_LOCKED,
     EXPECTED_STATE_UNLOCKED,
+    INTERNAL_DATA_PATHS,
     SERVICE_FORCE_UPDATE_KEY,
     SERVICE_LOCK_DOORS_KEY,
     SERVICE_REFRESH_TOKENS_KEY,
@@ -46,18 +76,31 @@ from .const import (
     SERVICE_STOP_HONK_KEY,
     SERVICE_UNLOCK_DOORS_KEY,
 )
+from .circuit_breaker import CircuitOpenError
+from .command_queue import get_command_queue
+from .coordinator import LynkCoDataUpdateCoordinator, get_data_age, prune_payload
 from .data_fetcher import (
     async_fetch_vehicle_address_data,
     async_fetch_vehicle_record_data,
     async_fetch_vehicle_shadow_data,
 )
 from .expected_state_monitor import ExpectedStateMonitor
+from .geocoding_cache import get_geocode_cache
+from .http_client import ClientClosedError, LynkCoHttpClient
+from .poll_scheduler import AdaptivePollScheduler, poll_phase
+from .quiet_schedule import QuietSchedule, parse_quiet_windows
+from .rate_limiter import (
+    BudgetExhaustedError,
+    async_get_rate_limiter,
+    async_remove_rate_limiter,
+)
 from .remote_control_manager import (
-    force_update_data,
+    is_command_redundant,
     lock_doors,
     start_climate,
     start_engine,
     start_flash_lights,
+    start_force_update,
     start_honk,
     start_honk_flash,
     stop_climate,
@@ -66,9 +109,18 @@ from .remote_control_manager import (
     stop_honk,
     unlock_doors,
 )
-from .token_manager import refresh_tokens
+from .snapshot_store import SnapshotStore
+from .token_manager import (
+    TokenRefreshScheduler,
+    async_migrate_legacy_tokens,
+    async_refresh_ccc_token,
+    async_remove_tokens,
+)
+from .vehicle_snapshot import FrozenDict, VehicleSnapshotHistory
 
 _LOGGER = logging.getLogger(__name__)
+# Vehicles of an entry whose data is fetched at the same time
+MAX_CONCURRENT_VEHICLE_POLLS = 2
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: config_validation.empty_config_schema(DOMAIN)}, extra=vol.ALLOW_EXTRA
 )
@@ -89,13 +141,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.debug(f"Entry {entry.entry_id} is already set up.")
         return True
 
-    expected_state_monitor = ExpectedStateMonitor()
+    account_id = entry.data.get(CONFIG_ACCOUNT_ID_KEY)
+    rate_limiter = await async_get_rate_limiter(
+        hass, account_id, entry.options.get(CONFIG_DAILY_API_BUDGET_KEY, 2000)
+    )
+    client = LynkCoHttpClient(rate_limiter, account_id)
+    token_refresh = TokenRefreshScheduler(hass, client)
     hass.data[DOMAIN][entry.entry_id] = {
-        DATA_IS_FORCE_UPDATE: False,
-        DATA_STORED_DATA: {},
-        CONFIG_VIN_KEY: entry.data.get(CONFIG_VIN_KEY),
-        DATA_EXPECTED_STATE: expected_state_monitor,
+        DATA_VEHICLES: {
+            vin: {
+                DATA_IS_FORCE_UPDATE: set(),
+                DATA_FORCED_REFRESHES: {},
+                DATA_SNAPSHOT_HISTORY: VehicleSnapshotHistory(vin),
+                DATA_EXPECTED_STATE: ExpectedStateMonitor(vin),
+            }
+            for vin in entry.data.get(CONFIG_VINS_KEY, [])
+        },
+        DATA_HTTP_CLIENT: client,
+        DATA_TOKEN_REFRESH: token_refresh,
+        DATA_SNAPSHOT_STORE: SnapshotStore(hass, entry.entry_id),
+        DATA_POLL_SEMAPHORE: asyncio.Semaphore(MAX_CONCURRENT_VEHICLE_POLLS),
+        DATA_QUIET_SCHEDULE: get_quiet_schedule(entry),
     }
+    await token_refresh.async_start()
 
     _LOGGER.debug(f"Experimental: {entry.options.get(CONFIG_EXPERIMENTAL_KEY, False)}")
     await setup_data_coordinator(hass, entry)
@@ -107,31 +175,145 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Migrate an entry to the vehicles and tokens of its account."""
+    if entry.version == 1:
+        vin = entry.data.get(CONFIG_VIN_KEY)
+        hass.config_entries.async_update_entry(
+            entry, data={CONFIG_VINS_KEY: [vin] if vin else []}, version=2
+        )
+        _LOGGER.info(f"Migrated entry {entry.entry_id} to version 2")
+    if entry.version == 2:
+        # The shared token store is removed once the last entry has been moved off it
+        remove_legacy = not any(
+            other.version < 3
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        )
+        account_id = await async_migrate_legacy_tokens(hass, entry, remove_legacy)
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONFIG_ACCOUNT_ID_KEY: account_id}, version=3
+        )
+        _LOGGER.info(f"Migrated entry {entry.entry_id} to version 3")
+    return True
+
+
 async def options_update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
 
-    update_interval_minutes = max(60, entry.options.get(CONFIG_SCAN_INTERVAL_KEY, 240))
-    _LOGGER.debug(f"Will update every: {update_interval_minutes} min")
-
-    # Retrieve and update the coordinator's interval
-    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    coordinator.update_interval = timedelta(minutes=update_interval_minutes)
+    # Apply the new polling bounds, the next poll picks its delay from them
+    vehicles = hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES]
+    for vehicle in vehicles.values():
+        for data_key, poll_scheduler in vehicle[DATA_POLL_SCHEDULERS].items():
+            poll_scheduler.update_settings(*get_poll_settings(entry, data_key))
+            vehicle[COORDINATORS][data_key].update_interval = poll_scheduler.max_interval
+    hass.data[DOMAIN][entry.entry_id][DATA_QUIET_SCHEDULE] = get_quiet_schedule(entry)
+    rate_limiter = hass.data[DOMAIN][entry.entry_id][DATA_HTTP_CLIENT].rate_limiter
+    rate_limiter.daily_budget = entry.options.get(CONFIG_DAILY_API_BUDGET_KEY, 2000)
     await register_services(hass, entry)
-    await coordinator.async_refresh()
+    await asyncio.gather(
+        *(
+            vehicle[COORDINATORS][data_key].async_refresh()
+            for vehicle in vehicles.values()
+            for data_key in (DATA_RECORD_KEY, DATA_SHADOW_KEY)
+        )
+    )
+
+
+def get_service_targets(hass: HomeAssistant, call):
+    """Return the (entry, vin) of the vehicles a service call targets.
+
+    Without a vin in the call every vehicle of every loaded entry is targeted.
+    """
+    vin = call.data.get(CONFIG_VIN_KEY)
+    targets = [
+        (entry, entry_vin)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in hass.data.get(DOMAIN, {})
+        for entry_vin in hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES]
+        if vin is None or entry_vin == vin
+    ]
+    if not targets:
+        raise HomeAssistantError(f"No Lynk & Co vehicle {vin or ''} is set up")
+    return targets
+
+
+def get_command_target(hass: HomeAssistant, call):
+    """Return the (entry, vin) of the single vehicle a command targets."""
+    targets = get_service_targets(hass, call)
+    if len(targets) > 1:
+        raise HomeAssistantError(
+            "Several Lynk & Co vehicles are set up, pass the vin of the vehicle"
+        )
+    return targets[0]
+
+
+async def run_command(hass: HomeAssistant, call, command, *args, expected_state=None):
+    """Queue a command and optionally wait until its expected state is observed.
+
+    The command is sent as command(hass, vin, *args, client). Equal
+    commands with equal arguments are deduplicated by the command queue,
+    and commands whose state recent data already shows are skipped
+    unless forced. The expected state is only watched once the command
+    was sent.
+    """
+    command_entry, vin = get_command_target(hass, call)
+    entry_data = hass.data[DOMAIN][command_entry.entry_id]
+    if not call.data.get("force", False) and is_command_redundant(
+        hass, command_entry, vin, expected_state
+    ):
+        return {"result": COMMAND_RESULT_SKIPPED, "latency": 0.0}
+    started = time.monotonic()
+    try:
+        result = await get_command_queue(hass, vin).async_submit(
+            (call.service, *args),
+            partial(command, hass, vin, *args, entry_data[DATA_HTTP_CLIENT]),
+            expected_state,
+        )
+    except (
+        CircuitOpenError,
+        BudgetExhaustedError,
+        ClientClosedError,
+        aiohttp.ClientError,
+        asyncio.TimeoutError,
+    ) as error:
+        _LOGGER.error(f"Command {call.service} for {vin} failed: {error!r}")
+        result = COMMAND_RESULT_FAILED
+    confirmation = None
+    if result == COMMAND_RESULT_SENT and expected_state is not None:
+        expected_state_monitor = entry_data[DATA_VEHICLES][vin][DATA_EXPECTED_STATE]
+        confirmation = await expected_state_monitor.expect_state(
+            expected_state, hass, command_entry
+        )
+    if confirmation is not None and call.data.get("wait_for_confirmation", False):
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(confirmation),
+                call.data.get("timeout", CONFIRMATION_TIMEOUT_SECONDS),
+            )
+        except asyncio.TimeoutError:
+            result = COMMAND_RESULT_TIMED_OUT
+    latency = round(time.monotonic() - started, 1)
+    _LOGGER.debug(f"Command {call.service} finished as {result} after {latency} s")
+    return {"result": result, "latency": latency}
 
 
 async def register_services(hass: HomeAssistant, entry: ConfigEntry):
     """Register or unregister services based on the experimental option."""
-    vin = hass.data[DOMAIN][entry.entry_id][CONFIG_VIN_KEY]
-    expected_state_monitor: ExpectedStateMonitor = hass.data[DOMAIN][entry.entry_id][
-        DATA_EXPECTED_STATE
-    ]
     experimental = entry.options.get(CONFIG_EXPERIMENTAL_KEY, False)
     _LOGGER.info(f"Register services using experimental: {experimental}")
 
     # Define async wrappers for your coroutine service calls
     async def refresh_tokens_service(call):
-        await refresh_tokens(hass)
+        """Refresh the tokens of every account with a loaded entry, once per account."""
+        refreshed_accounts = set()
+        for loaded_entry in hass.config_entries.async_entries(DOMAIN):
+            entry_data = hass.data[DOMAIN].get(loaded_entry.entry_id)
+            account_id = loaded_entry.data.get(CONFIG_ACCOUNT_ID_KEY)
+            if entry_data is None or account_id in refreshed_accounts:
+                continue
+            refreshed_accounts.add(account_id)
+            await async_refresh_ccc_token(hass, entry_data[DATA_HTTP_CLIENT])
 
     async def start_climate_service(call):
         climate_level = call.data.get(
@@ -140,85 +322,177 @@ async def register_services(hass: HomeAssistant, entry: ConfigEntry):
         ).upper()
         duration_in_minutes = call.data.get("duration_in_minutes", 15)
 
-        await expected_state_monitor.expect_state(
-            EXPECTED_STATE_CLIMATE_ON, hass, entry
+        return await run_command(
+            hass,
+            call,
+            start_climate,
+            climate_level,
+            duration_in_minutes,
+            expected_state=EXPECTED_STATE_CLIMATE_ON,
         )
-        await start_climate(hass, vin, climate_level, duration_in_minutes)
 
     async def stop_climate_service(call):
-        await expected_state_monitor.expect_state(
-            EXPECTED_STATE_CLIMATE_OFF, hass, entry
+        return await run_command(
+            hass, call, stop_climate, expected_state=EXPECTED_STATE_CLIMATE_OFF
         )
-        await stop_climate(hass, vin)
 
     async def lock_doors_service(call):
-        await expected_state_monitor.expect_state(EXPECTED_STATE_LOCKED, hass, entry)
-        await lock_doors(hass, vin)
+        return await run_command(
+            hass, call, lock_doors, expected_state=EXPECTED_STATE_LOCKED
+        )
 
     async def unlock_doors_service(call):
-        await expected_state_monitor.expect_state(EXPECTED_STATE_UNLOCKED, hass, entry)
-        await unlock_doors(hass, vin)
+        return await run_command(
+            hass, call, unlock_doors, expected_state=EXPECTED_STATE_UNLOCKED
+        )
 
     async def start_flash_lights_service(call):
-        await start_flash_lights(hass, vin)
+        return await run_command(hass, call, start_flash_lights)
 
     async def stop_flash_lights_service(call):
-        await stop_flash_lights(hass, vin)
+        return await run_command(hass, call, stop_flash_lights)
 
     async def start_honk_service(call):
-        await start_honk(hass, vin)
+        return await run_command(hass, call, start_honk)
 
     async def start_honk_flash_service(call):
-        await start_honk_flash(hass, vin)
+        return await run_command(hass, call, start_honk_flash)
 
     async def stop_honk_service(call):
-        await stop_honk(hass, vin)
+        return await run_command(hass, call, stop_honk)
 
     async def force_update_data_service(call):
-        await force_update_data(hass, entry)
+        """Refresh the targeted vehicles and return their data and its age.
+
+        With background the current data is returned at once while the
+        refresh runs on. Vehicles whose data is newer than max_age seconds
+        are not refreshed.
+        """
+        max_age = call.data.get("max_age")
+        refreshes = {}
+        targets = get_service_targets(hass, call)
+        for target_entry, vin in targets:
+            coordinators = hass.data[DOMAIN][target_entry.entry_id][DATA_VEHICLES][vin][
+                COORDINATORS
+            ]
+            data_age = get_data_age(coordinators, (DATA_RECORD_KEY, DATA_SHADOW_KEY))
+            if max_age is not None and data_age is not None and data_age <= max_age:
+                _LOGGER.debug(f"Data of {vin} is {int(data_age)} s old, not updating")
+                continue
+            refreshes[vin] = start_force_update(hass, target_entry, vin)
+        if not call.data.get("background", False):
+            await asyncio.gather(
+                *(asyncio.shield(task) for tasks in refreshes.values() for task in tasks)
+            )
+
+        vehicles = {}
+        for target_entry, vin in targets:
+            coordinators = hass.data[DOMAIN][target_entry.entry_id][DATA_VEHICLES][vin][
+                COORDINATORS
+            ]
+            data_age = get_data_age(coordinators, (DATA_RECORD_KEY, DATA_SHADOW_KEY))
+            data = {}
+            for coordinator in coordinators.values():
+                data.update(coordinator.data or {})
+            vehicles[vin] = {
+                "data_age": None if data_age is None else round(data_age, 1),
+                "refreshing": any(not task.done() for task in refreshes.get(vin, ())),
+                "data": data,
+            }
+        return {"vehicles": vehicles}
 
     async def start_engine_service(call):
-        await expected_state_monitor.expect_state(EXPECTED_STATE_ENGINE_ON, hass, entry)
-        await start_engine(hass, vin, call.data.get("duration_in_minutes", 15))
+        return await run_command(
+            hass,
+            call,
+            start_engine,
+            call.data.get("duration_in_minutes", 15),
+            expected_state=EXPECTED_STATE_ENGINE_ON,
+        )
 
     async def stop_engine_service(call):
-        await expected_state_monitor.expect_state(
-            EXPECTED_STATE_ENGINE_OFF, hass, entry
+        return await run_command(
+            hass, call, stop_engine, expected_state=EXPECTED_STATE_ENGINE_OFF
         )
-        await stop_engine(hass, vin)
 
     # Common services registration
     hass.services.async_register(
         DOMAIN, SERVICE_REFRESH_TOKENS_KEY, refresh_tokens_service
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_START_CLIMATE_KEY, start_climate_service
+        DOMAIN,
+        SERVICE_START_CLIMATE_KEY,
+        start_climate_service,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_CLIMATE_KEY,
+        stop_climate_service,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LOCK_DOORS_KEY,
+        lock_doors_service,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UNLOCK_DOORS_KEY,
+        unlock_doors_service,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_FLASHLIGHT_KEY,
+        start_flash_lights_service,
+        supports_response=SupportsResponse.OPTIONAL,
     )
-    hass.services.async_register(DOMAIN, SERVICE_STOP_CLIMATE_KEY, stop_climate_service)
-    hass.services.async_register(DOMAIN, SERVICE_LOCK_DOORS_KEY, lock_doors_service)
-    hass.services.async_register(DOMAIN, SERVICE_UNLOCK_DOORS_KEY, unlock_doors_service)
     hass.services.async_register(
-        DOMAIN, SERVICE_START_FLASHLIGHT_KEY, start_flash_lights_service
+        DOMAIN,
+        SERVICE_STOP_FLASHLIGHT_KEY,
+        stop_flash_lights_service,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_STOP_FLASHLIGHT_KEY, stop_flash_lights_service
+        DOMAIN,
+        SERVICE_START_HONK_KEY,
+        start_honk_service,
+        supports_response=SupportsResponse.OPTIONAL,
     )
-    hass.services.async_register(DOMAIN, SERVICE_START_HONK_KEY, start_honk_service)
     hass.services.async_register(
-        DOMAIN, SERVICE_START_HONK_FLASH_KEY, start_honk_flash_service
+        DOMAIN,
+        SERVICE_START_HONK_FLASH_KEY,
+        start_honk_flash_service,
+        supports_response=SupportsResponse.OPTIONAL,
     )
-    hass.services.async_register(DOMAIN, SERVICE_STOP_HONK_KEY, stop_honk_service)
     hass.services.async_register(
-        DOMAIN, SERVICE_FORCE_UPDATE_KEY, force_update_data_service
+        DOMAIN,
+        SERVICE_STOP_HONK_KEY,
+        stop_honk_service,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FORCE_UPDATE_KEY,
+        force_update_data_service,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     # Experimental services
     if experimental:
         hass.services.async_register(
-            DOMAIN, SERVICE_START_ENGINE_KEY, start_engine_service
+            DOMAIN,
+            SERVICE_START_ENGINE_KEY,
+            start_engine_service,
+            supports_response=SupportsResponse.OPTIONAL,
         )
         hass.services.async_register(
-            DOMAIN, SERVICE_STOP_ENGINE_KEY, stop_engine_service
+            DOMAIN,
+            SERVICE_STOP_ENGINE_KEY,
+            stop_engine_service,
+            supports_response=SupportsResponse.OPTIONAL,
         )
     else:
         await safely_remove_service(hass, DOMAIN, SERVICE_START_ENGINE_KEY)
@@ -237,127 +511,242 @@ async def safely_remove_service(hass: HomeAssistant, domain: str, service: str):
 
 
 async def setup_data_coordinator(hass: HomeAssistant, entry: ConfigEntry):
-    update_interval_minutes = max(60, entry.options.get(CONFIG_SCAN_INTERVAL_KEY, 240))
-    _LOGGER.debug(f"Will update every: {update_interval_minutes} min")
-    """Setup the data update coordinator."""
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{DOMAIN}_{entry.entry_id}_vehicle_data",
-        update_method=lambda: update_data(hass, entry),
-        update_interval=timedelta(minutes=update_interval_minutes),
-        request_refresh_debouncer=Debouncer(hass, _LOGGER, cooldown=10, immediate=True),
-    )
+    """Setup the data update coordinators of every vehicle."""
+    vehicles = hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES]
+    data_keys = (DATA_RECORD_KEY, DATA_SHADOW_KEY)
+    for vehicle_index, (vin, vehicle) in enumerate(vehicles.items()):
+        vehicle[DATA_POLL_SCHEDULERS] = {
+            data_key: AdaptivePollScheduler(
+                *get_poll_settings(entry, data_key),
+                poll_phase(
+                    entry.entry_id,
+                    vehicle_index,
+                    len(vehicles),
+                    domain_index,
+                    len(data_keys),
+                ),
+            )
+            for domain_index, data_key in enumerate(data_keys)
+        }
+        vehicle[COORDINATORS] = create_vehicle_coordinators(hass, entry, vin)
+
+    # Start from the last known data and refresh it in the background, only
+    # block on the cloud for data domains that were never fetched before.
+    # Fetches of all vehicles share the entry's bounded poll semaphore, and
+    # background refreshes are ramped in by the phase of each vehicle.
+    snapshot = await hass.data[DOMAIN][entry.entry_id][DATA_SNAPSHOT_STORE].async_load()
+    first_refreshes = []
+    for vin, vehicle in vehicles.items():
+        vehicle_snapshot = snapshot.get(vin, {})
+        for data_key, coordinator in vehicle[COORDINATORS].items():
+            if data_key in vehicle_snapshot:
+                stored = vehicle_snapshot[data_key]
+                if data_key != DATA_ADDRESS_KEY:
+                    stored = stored.get(data_key)
+                data = vehicle[DATA_SNAPSHOT_HISTORY].commit(data_key, stored)
+                coordinator.async_set_updated_data(get_coordinator_data(data_key, data))
+            if data_key == DATA_ADDRESS_KEY:
+                # Refreshed by the record coordinator once it has a position
+                continue
+            if data_key in vehicle_snapshot:
+                startup_delay = vehicle[DATA_POLL_SCHEDULERS][data_key].startup_delay()
+                entry.async_create_background_task(
+                    hass,
+                    async_delayed_refresh(coordinator, startup_delay),
+                    f"{coordinator.name}_refresh",
+                )
+            else:
+                first_refreshes.append(coordinator.async_config_entry_first_refresh())
+    await asyncio.gather(*first_refreshes)
+
+
+def get_coordinator_data(data_key, data):
+    """Return the coordinator data holding the data of one data domain."""
+    if data_key == DATA_ADDRESS_KEY:
+        return data
+    return FrozenDict({data_key: data})
+
+
+async def async_delayed_refresh(coordinator, delay):
+    """Refresh a coordinator after a delay in seconds."""
+    await asyncio.sleep(delay)
+    await coordinator.async_refresh()
 
-    if entry.entry_id in hass.data[DOMAIN]:
-        hass.data[DOMAIN][entry.entry_id][COORDINATOR] = coordinator
-    else:
-        _LOGGER.error(
-            f"Failed to set coordinator for entry {entry.entry_id}, with {DOMAIN} in {hass.data[DOMAIN]}"
-        )
 
-    await coordinator.async_config_entry_first_refresh()
+def create_vehicle_coordinators(hass: HomeAssistant, entry: ConfigEntry, vin):
+    """Create one data update coordinator per data domain of a vehicle."""
+    poll_schedulers = hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES][vin][
+        DATA_POLL_SCHEDULERS
+    ]
+    return {
+        DATA_RECORD_KEY: LynkCoDataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{vin}_vehicle_record",
+            update_method=lambda: update_data(
+                hass, entry, vin, DATA_RECORD_KEY, async_fetch_vehicle_record_data
+            ),
+            update_interval=poll_schedulers[DATA_RECORD_KEY].max_interval,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=10, immediate=True
+            ),
+        ),
+        DATA_SHADOW_KEY: LynkCoDataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{vin}_vehicle_shadow",
+            update_method=lambda: update_data(
+                hass, entry, vin, DATA_SHADOW_KEY, async_fetch_vehicle_shadow_data
+            ),
+            update_interval=poll_schedulers[DATA_SHADOW_KEY].max_interval,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=10, immediate=True
+            ),
+        ),
+        DATA_ADDRESS_KEY: LynkCoDataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{vin}_vehicle_address",
+            update_method=lambda: update_address(hass, entry, vin),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=10, immediate=True
+            ),
+        ),
+    }
 
 
-async def update_data(hass: HomeAssistant, entry: ConfigEntry):
-    """Update vehicle data."""
-    vin = hass.data[DOMAIN][entry.entry_id][CONFIG_VIN_KEY]
-    is_force_update = hass.data[DOMAIN][entry.entry_id][DATA_IS_FORCE_UPDATE]
-    hass.data[DOMAIN][entry.entry_id][DATA_IS_FORCE_UPDATE] = False
-    combined_data = hass.data[DOMAIN][entry.entry_id].get(DATA_STORED_DATA, {})
+def get_poll_settings(entry: ConfigEntry, data_key):
+    """Return the adaptive polling bounds in minutes and the backoff factor."""
+    if data_key == DATA_RECORD_KEY:
+        max_interval_minutes = entry.options.get(CONFIG_SCAN_INTERVAL_KEY, 240)
+    else:
+        max_interval_minutes = entry.options.get(CONFIG_SHADOW_SCAN_INTERVAL_KEY, 30)
+    return (
+        entry.options.get(CONFIG_POLL_MIN_INTERVAL_KEY, 5),
+        max_interval_minutes,
+        entry.options.get(CONFIG_POLL_BACKOFF_FACTOR_KEY, 2.0),
+    )
+
+
+def get_quiet_schedule(entry: ConfigEntry):
+    """Return the windows without automatic updates: the daily dark hours plus the quiet windows."""
+    windows = parse_quiet_windows(entry.options.get(CONFIG_QUIET_WINDOWS_KEY, ""))
     dark_hours_start = int(entry.options.get(CONFIG_DARK_HOURS_START, 1))
     dark_hours_end = int(entry.options.get(CONFIG_DARK_HOURS_END, 4))
+    if dark_hours_start != dark_hours_end:
+        duration = (dark_hours_end - dark_hours_start) % 24 * 60
+        windows += [(weekday, dark_hours_start * 60, duration) for weekday in range(7)]
+    return QuietSchedule(windows)
+
+
+async def update_data(hass: HomeAssistant, entry: ConfigEntry, vin, data_key, fetch):
+    """Update the vehicle data of one data domain of a vehicle."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    vehicle = entry_data[DATA_VEHICLES][vin]
+    client = entry_data[DATA_HTTP_CLIENT]
+    forced_updates = vehicle[DATA_IS_FORCE_UPDATE]
+    is_force_update = data_key in forced_updates
+    forced_updates.discard(data_key)
+    snapshots = vehicle[DATA_SNAPSHOT_HISTORY]
+    snapshot = snapshots.current
+    previous_data = (
+        get_coordinator_data(data_key, snapshot.get(data_key))
+        if data_key in snapshot
+        else {}
+    )
     if not vin:
         _LOGGER.error("Missing VIN for vehicle data update.")
         raise UpdateFailed("Missing VIN.")
-    now = datetime.now()
-    is_interval_spanning_two_days = dark_hours_end < dark_hours_start
-    is_current_time_in_dark_hours = (
-        is_interval_spanning_two_days
-        and (now.hour >= dark_hours_start or now.hour < dark_hours_end)
-    ) or (
-        not is_interval_spanning_two_days
-        and dark_hours_start <= now.hour < dark_hours_end
-    )
-    if not is_force_update and (is_current_time_in_dark_hours):
+    coordinator = vehicle[COORDINATORS][data_key]
+    poll_scheduler = vehicle[DATA_POLL_SCHEDULERS][data_key]
+    quiet_schedule = entry_data[DATA_QUIET_SCHEDULE]
+    # Automatic polls are scheduled after the quiet windows, this only
+    # happens for the first refresh after a restart inside a window
+    if not is_force_update and quiet_schedule.is_quiet(dt_util.now()):
         _LOGGER.debug("Skipping automatic update due to time restrictions.")
-        return combined_data
+        coordinator.update_interval = poll_scheduler.next_interval(
+            snapshot.data, quiet_schedule
+        )
+        return previous_data
+
+    async with entry_data[DATA_POLL_SEMAPHORE]:
+        data = await fetch(hass, vin, client)
+    if not data:
+        _LOGGER.error(f"Failed to fetch {data_key} data for {vin}.")
+        coordinator.update_interval = poll_scheduler.next_interval(
+            snapshot.data, quiet_schedule
+        )
+        return previous_data
+
+    # Only keep what the entities and the integration itself read
+    data = prune_payload(data, data_key, get_retained_paths(entry, coordinator))
+    # Swap in a new immutable snapshot sharing the unchanged subtrees
+    fetched_at = time.time()
+    data = snapshots.commit(data_key, data, fetched_at)
+    coordinator.fetched_at = fetched_at
+    entry_data[DATA_SNAPSHOT_STORE].async_save(vin, data_key, {data_key: data})
+    coordinator.update_interval = poll_scheduler.next_interval(
+        snapshots.current.data, quiet_schedule
+    )
+    if data_key == DATA_RECORD_KEY:
+        # Resolve the address in the background so it never delays the other entities
+        address_coordinator = vehicle[COORDINATORS][DATA_ADDRESS_KEY]
+        hass.async_create_task(address_coordinator.async_request_refresh())
+    return get_coordinator_data(data_key, data)
+
 
-    record, shadow = await asyncio.gather(
-        async_fetch_vehicle_record_data(hass, vin),
-        async_fetch_vehicle_shadow_data(hass, vin),
+def get_retained_paths(entry: ConfigEntry, coordinator):
+    """Return the data paths kept of a fetched payload, None to keep all of it."""
+    allow_list = set(
+        entry.options.get(CONFIG_PAYLOAD_ALLOW_LIST_KEY, "").replace(",", " ").split()
     )
+    registered_paths = coordinator.registered_paths()
+    if "*" in allow_list or registered_paths is None:
+        return None
+    return registered_paths | allow_list | INTERNAL_DATA_PATHS
+
+
+async def update_address(hass: HomeAssistant, entry: ConfigEntry, vin):
+    """Resolve the address of the last fetched position of a vehicle."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    client = entry_data[DATA_HTTP_CLIENT]
+    snapshots = entry_data[DATA_VEHICLES][vin][DATA_SNAPSHOT_HISTORY]
+    record = snapshots.current.get(DATA_RECORD_KEY)
     latitude = None
     longitude = None
+    if isinstance(record, dict):
+        position = record.get("position")
+        if isinstance(position, dict):
+            latitude = position.get("latitude")
+            longitude = position.get("longitude")
 
-    if not record:
-        _LOGGER.error("Failed to fetch vehicle record data.")
-        return combined_data
-    else:
-        combined_data["vehicle_record"] = record
-        if isinstance(record, dict):
-            position = record.get("position")
-            if isinstance(position, dict):
-                latitude = position.get("latitude")
-                longitude = position.get("longitude")
-
-    if not shadow:
-        _LOGGER.error("Failed to fetch vehicle shadow data.")
-        return combined_data
-    else:
-        combined_data["vehicle_shadow"] = shadow
-
-    address_raw = "Unavailable"
-    if latitude is not None and longitude is not None:
-        address_response = await async_fetch_vehicle_address_data(
-            hass, latitude, longitude
-        )
-        address = parse_address(address_response)
-        if (
-            isinstance(address_response, dict)
-            and "addressComponents" in address_response
-        ):
-            address_data = address_response["addressComponents"]
-            address_raw = ", ".join(component["longName"] for component in address_data)
-    else:
-        address = "Unavailable"
+    if latitude is None or longitude is None:
         _LOGGER.error("Latitude or longitude not available for address lookup.")
-
-    combined_data["vehicle_address"] = address
-    combined_data["vehicle_address_raw"] = address_raw
-    hass.data[DOMAIN][entry.entry_id][DATA_STORED_DATA] = combined_data
-    return combined_data
-
-
-def parse_address(address_response):
-    # Define the types of address components you are interested in
-    desired_types = {
-        "street_name": ["route", "street", "road"],  # Street name variations
-        "street_number": ["street_number"],  # Street number
-        "city": [
-            "postal_town",
-            "locality",
-            "administrative_area_level_2",
-        ],  # City variations
-    }
-
-    street_name, street_number, city = "", "", ""
-
-    for component in address_response["addressComponents"]:
-        for comp_type in component["types"]:
-            if comp_type in desired_types["street_name"]:
-                street_name = component["longName"]
-            elif comp_type in desired_types["street_number"]:
-                street_number = component["longName"]
-            elif comp_type in desired_types["city"]:
-                city = component["longName"]
-            if street_name or street_number or city:
-                break
-
-    street_address = f"{street_name} {street_number}".strip()
-    formatted_address = ", ".join(filter(None, [street_address, city]))
-
-    return formatted_address
+        return {
+            DATA_ADDRESS_KEY: "Unavailable",
+            f"{DATA_ADDRESS_KEY}_raw": "Unavailable",
+        }
+
+    resolved = await get_geocode_cache(hass).async_get_address(
+        vin,
+        latitude,
+        longitude,
+        entry.options.get(CONFIG_GEOCODE_MIN_DISTANCE_KEY, 50),
+        lambda: async_fetch_vehicle_address_data(hass, latitude, longitude, client),
+    )
+    if not resolved:
+        raise UpdateFailed("Failed to resolve vehicle address.")
+    address, address_raw = resolved
+    address_data = snapshots.commit(
+        DATA_ADDRESS_KEY,
+        {
+            DATA_ADDRESS_KEY: address,
+            f"{DATA_ADDRESS_KEY}_raw": address_raw,
+        },
+        time.time(),
+    )
+    entry_data[DATA_SNAPSHOT_STORE].async_save(vin, DATA_ADDRESS_KEY, address_data)
+    return address_data
 
 
 async def async_remove_config_entry_device(
@@ -386,13 +775,28 @@ async def async_remove_config_entry_device(
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove the stored data of a deleted configuration entry and of its account if unused."""
+    await SnapshotStore(hass, entry.entry_id).async_remove()
+    account_id = entry.data.get(CONFIG_ACCOUNT_ID_KEY)
+    if account_id is not None and not any(
+        other.data.get(CONFIG_ACCOUNT_ID_KEY) == account_id
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ):
+        await async_remove_tokens(hass, account_id)
+        await async_remove_rate_limiter(hass, account_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a configuration entry."""
     platforms = ["sensor", "binary_sensor", "lock", "device_tracker"]
     unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if unload_ok:
-        # Clean up integration data
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Clean up integration data and close pooled connections
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data[DATA_TOKEN_REFRESH].async_stop()
+        await entry_data[DATA_HTTP_CLIENT].async_close()
         _LOGGER.debug(f"Unloaded entry {entry.entry_id}")
     else:
         _LOGGER.error(f"Failed to unload entry {entry.entry_id}")
@@ -4,44 +4,45 @@ from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
 
-from .const import COORDINATOR, DOMAIN
+from .const import COORDINATORS, DATA_VEHICLES, DOMAIN
+from .coordinator import get_coordinator_for_path
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    vin = entry.data.get("vin")
-    async_add_entities(
-        [
+    entities = []
+    for vin, vehicle in hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES].items():
+        coordinators = vehicle[COORDINATORS]
+        entities += [
             LynkCoBinarySensor(
-                coordinator,
+                coordinators,
                 vin,
                 "Pre climate active",
                 "vehicle_record.climate.preClimateActive",
                 icon="mdi:air-conditioner",
             ),
             LynkCoBinarySensor(
-                coordinator,
+                coordinators,
                 vin,
                 "Vehicle is running",
                 "vehicle_shadow.bvs.engineStatus",
                 icon="mdi:engine",
             ),
             LynkCoBinarySensor(
-                coordinator,
+                coordinators,
                 vin,
                 "Lynk & Co Position is trusted",
                 "vehicle_record.position.canBeTrusted",
             ),
         ]
-    )
+    async_add_entities(entities)
 
 
 class LynkCoBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def __init__(
         self,
-        coordinator,
+        coordinators,
         vin,
         name,
         data_path,
@@ -49,16 +50,18 @@ class LynkCoBinarySensor(CoordinatorEntity, BinarySensorEntity):
         device_class=None,
         icon=None,
     ):
-        super().__init__(coordinator)
-        self.coordinator = coordinator
+        super().__init__(
+            get_coordinator_for_path(coordinators, data_path),
+            context=frozenset(filter(None, (data_path, car_updated_at))),
+        )
         self._vin = vin
         self._name = name
         self._data_path = data_path
-        self._car_updated_at_path = (
-            car_updated_at.split(".") if car_updated_at else None
-        )
+        self._car_updated_at_path = car_updated_at
         self._device_class = device_class
         self._icon = icon
+        self._available = False
+        self._available_generation = None
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"lynk_co_{self._vin}")},
@@ -72,38 +75,29 @@ class LynkCoBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def is_on(self):
-        if self.coordinator.data:
-            data_path = self._data_path.split(".")
-            data = self.coordinator.data
-            for key in data_path:
-                if data is not None and key in data:
-                    data = data[key]
-                else:
-                    return False
-
-            if data == "ENGINE_RUNNING":
-                return True
-            elif data == "ENGINE_OFF":
-                return False
-            return bool(data)
-        return False
+        data = self.coordinator.get_value(self._data_path, False)
+        if data == "ENGINE_RUNNING":
+            return True
+        elif data == "ENGINE_OFF":
+            return False
+        return bool(data)
 
     @property
     def available(self):
-        if self.coordinator.data:
-            data_path = self._data_path.split(".")
-            data = self.coordinator.data
-            for key in data_path:
-                if data is not None and key in data:
-                    data = data[key]
-                else:
+        # Resolved once per coordinator update, not on every state write
+        if self._available_generation != self.coordinator.data_generation:
+            self._available_generation = self.coordinator.data_generation
+            if self.coordinator.has_path(self._data_path):
+                self._available = (
+                    self.coordinator.get_value(self._data_path) != "NO_ENGINE_INFO"
+                )
+            else:
+                if self.coordinator.data:
                     _LOGGER.error(
                         f"Data path not found: {self._data_path}, coodinator.data: {self.coordinator.data}"
                     )
-                    return False  # Data path not found, mark as unavailable
-            if data != "NO_ENGINE_INFO":
-                return True  # Data path found, mark as available
-        return False
+                self._available = False  # Data path not found, mark as unavailable
+        return self._available
 
     @property
     def device_class(self):
@@ -121,10 +115,7 @@ class LynkCoBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def extra_state_attributes(self):
         attributes = {}
         if self._car_updated_at_path:
-            data = self.coordinator.data
-            for key in self._car_updated_at_path:
-                if data:
-                    data = data.get(key)
+            data = self.coordinator.get_value(self._car_updated_at_path)
             if data:
                 attributes["car_updated_at"] = data
         return attributes
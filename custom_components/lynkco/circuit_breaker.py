@@ -0,0 +1,79 @@
+"""Circuit breaker failing fast while a backend host is down."""
+
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT_SECONDS = 60
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a request while the circuit of its host is open."""
+
+
+class CircuitBreaker:
+    """Track consecutive failures of one host.
+
+    After CIRCUIT_FAILURE_THRESHOLD consecutive failures the circuit opens and
+    requests fail immediately. Once CIRCUIT_RESET_TIMEOUT_SECONDS have passed a
+    single probe request is let through: success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, host, on_change=None):
+        self.host = host
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+        self._on_change = on_change
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may be made now."""
+        if self.state == CIRCUIT_CLOSED:
+            return
+        if (
+            self.state == CIRCUIT_OPEN
+            and time.monotonic() - self.opened_at >= CIRCUIT_RESET_TIMEOUT_SECONDS
+        ):
+            self._set_state(CIRCUIT_HALF_OPEN)
+        if self.state == CIRCUIT_HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        raise CircuitOpenError(f"Circuit for {self.host} is {self.state}")
+
+    def record_success(self):
+        """Record a request the host answered."""
+        self.failures = 0
+        self._probe_in_flight = False
+        if self.state != CIRCUIT_CLOSED:
+            self._set_state(CIRCUIT_CLOSED)
+
+    def record_cancelled(self):
+        """Record a request abandoned by its caller, which says nothing about the host."""
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        """Record a request that failed or that the host could not serve."""
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == CIRCUIT_HALF_OPEN or self.failures >= CIRCUIT_FAILURE_THRESHOLD:
+            self.opened_at = time.monotonic()
+            if self.state != CIRCUIT_OPEN:
+                self._set_state(CIRCUIT_OPEN)
+
+    def _set_state(self, state):
+        log = _LOGGER.warning if state == CIRCUIT_OPEN else _LOGGER.info
+        log(f"Circuit for {self.host} changed from {self.state} to {state}")
+        self.state = state
+        if self._on_change is not None:
+            self._on_change()
+
+    def as_dict(self):
+        return {"state": self.state, "failures": self.failures}
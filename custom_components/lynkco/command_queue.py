@@ -0,0 +1,142 @@
+"""Per-vehicle queue serializing remote commands."""
+
+import asyncio
+import logging
+import time
+
+from .const import (
+    COMMAND_RESULT_FAILED,
+    COMMAND_RESULT_SENT,
+    COMMAND_RESULT_SUPERSEDED,
+    DATA_COMMAND_QUEUES,
+    DOMAIN,
+    OPPOSITE_EXPECTED_STATES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# A repeat of the last sent command within this window is not sent again
+COMMAND_DEDUP_WINDOW_SECONDS = 10
+
+
+class QueuedCommand:
+    """A command waiting to be sent, with the future its callers wait on."""
+
+    def __init__(self, command_key, command, expected_state, future):
+        self.command_key = command_key
+        self.command = command
+        self.expected_state = expected_state
+        self.future = future
+
+
+class CommandQueue:
+    """Send the commands of one vehicle one at a time.
+
+    A queued command is dropped when the opposite command is queued after it,
+    so only the last intended state reaches the backend. Submitting a command
+    that is already queued, or that was the last one sent less than
+    COMMAND_DEDUP_WINDOW_SECONDS ago with no opposite command queued since,
+    shares the result of that command.
+    """
+
+    def __init__(self, hass, vin):
+        self._hass = hass
+        self._vin = vin
+        self._pending = []
+        self._last_sent = None
+        # Set once an opposite of the last sent command was queued after it
+        self._last_sent_contradicted = False
+        self._worker = None
+
+    async def async_submit(self, command_key, command, expected_state=None):
+        """Queue a command and return its result once processed.
+
+        command_key identifies the command and its arguments, command is a
+        callable returning the coroutine that sends it.
+        """
+        # Supersede first, a queued opposite must never outlive a later command
+        opposite_state = OPPOSITE_EXPECTED_STATES.get(expected_state)
+        for queued in list(self._pending):
+            if opposite_state is not None and queued.expected_state == opposite_state:
+                _LOGGER.info(
+                    f"Dropping queued command {queued.command_key} superseded by {command_key}"
+                )
+                self._pending.remove(queued)
+                queued.future.set_result(COMMAND_RESULT_SUPERSEDED)
+
+        duplicate = self._find_duplicate(command_key)
+        if duplicate is not None:
+            _LOGGER.info(f"Dropping duplicate command {command_key} for {self._vin}")
+            return await asyncio.shield(duplicate)
+
+        if (
+            self._last_sent is not None
+            and opposite_state is not None
+            and self._last_sent[3] == opposite_state
+        ):
+            self._last_sent_contradicted = True
+        queued = QueuedCommand(
+            command_key, command, expected_state, self._hass.loop.create_future()
+        )
+        self._pending.append(queued)
+        if self._worker is None or self._worker.done():
+            self._worker = self._hass.async_create_task(self._async_process())
+        return await asyncio.shield(queued.future)
+
+    def has_pending_state(self, expected_state):
+        """Return True if a queued or in-flight command leads to the expected state."""
+        if any(queued.expected_state == expected_state for queued in self._pending):
+            return True
+        return (
+            self._last_sent is not None
+            and self._last_sent[3] == expected_state
+            and not self._last_sent[2].done()
+        )
+
+    def _find_duplicate(self, command_key):
+        """Return the future of an equal queued or recently sent command."""
+        for queued in self._pending:
+            if queued.command_key == command_key:
+                return queued.future
+        if self._last_sent is None or self._last_sent_contradicted:
+            return None
+        last_key, sent_at, future, _ = self._last_sent
+        if last_key != command_key or time.monotonic() - sent_at > COMMAND_DEDUP_WINDOW_SECONDS:
+            return None
+        # A failed command may be retried right away
+        if future.done() and (
+            future.exception() is not None or future.result() != COMMAND_RESULT_SENT
+        ):
+            return None
+        return future
+
+    async def _async_process(self):
+        while self._pending:
+            queued = self._pending.pop(0)
+            self._last_sent = (
+                queued.command_key,
+                time.monotonic(),
+                queued.future,
+                queued.expected_state,
+            )
+            self._last_sent_contradicted = False
+            try:
+                sent = await queued.command()
+            except Exception as error:
+                _LOGGER.error(f"Command {queued.command_key} failed: {error}")
+                queued.future.set_exception(error)
+                continue
+            queued.future.set_result(
+                COMMAND_RESULT_SENT if sent else COMMAND_RESULT_FAILED
+            )
+
+
+def get_command_queue(hass, vin):
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {}
+
+    command_queues = hass.data[DOMAIN].setdefault(DATA_COMMAND_QUEUES, {})
+    if vin not in command_queues:
+        command_queues[vin] = CommandQueue(hass, vin)
+
+    return command_queues[vin]
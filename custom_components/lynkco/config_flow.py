@@ -11,19 +11,30 @@ from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
     CONFIG_2FA_KEY,
+    CONFIG_ACCOUNT_ID_KEY,
+    CONFIG_COMMAND_PRECHECK_MAX_AGE_KEY,
+    CONFIG_DAILY_API_BUDGET_KEY,
     CONFIG_DARK_HOURS_END,
     CONFIG_DARK_HOURS_START,
     CONFIG_EMAIL_KEY,
     CONFIG_EXPERIMENTAL_KEY,
+    CONFIG_GEOCODE_MIN_DISTANCE_KEY,
     CONFIG_LOGIN_METHOD_DIRECT,
     CONFIG_LOGIN_METHOD_REDIRECT,
     CONFIG_PASSWORD_KEY,
+    CONFIG_PAYLOAD_ALLOW_LIST_KEY,
+    CONFIG_POLL_BACKOFF_FACTOR_KEY,
+    CONFIG_POLL_MIN_INTERVAL_KEY,
+    CONFIG_QUIET_WINDOWS_KEY,
     CONFIG_REDIRECT_URI_KEY,
     CONFIG_SCAN_INTERVAL_KEY,
+    CONFIG_SHADOW_SCAN_INTERVAL_KEY,
     CONFIG_VIN_KEY,
+    CONFIG_VINS_KEY,
     DOMAIN,
     STORAGE_REFRESH_TOKEN_KEY,
 )
+from .http_client import LynkCoHttpClient
 from .login_flow import (
     get_auth_uri,
     get_tokens_from_redirect_uri,
@@ -31,9 +42,12 @@ from .login_flow import (
     login,
     two_factor_authentication,
 )
+from .quiet_schedule import parse_quiet_windows
 from .token_manager import (
     STORAGE_CCC_TOKEN_KEY,
     decode_jwt_token,
+    get_account_id,
+    get_token_cache,
     get_token_storage,
     send_device_login,
 )
@@ -71,10 +85,17 @@ def is_valid_redirect_uri(redirect_uri: str) -> bool:
     return redirect_uri.startswith("msauth://prod.lynkco.app.crisp.prod/")
 
 
+def entry_title(vins):
+    """Return the title of an entry managing the given vehicles."""
+    if len(vins) == 1:
+        return f"Lynk & Co ({vins[0]})"
+    return f"Lynk & Co ({len(vins)} vehicles)"
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Lynk & Co."""
 
-    VERSION = 1
+    VERSION = 3
 
     @staticmethod
     def async_get_options_flow(config_entry):
@@ -84,31 +105,38 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _finalize_with_tokens(
         self, access_token: str, refresh_token: str, id_token: str
     ) -> config_entries.ConfigFlowResult:
-        token_storage = get_token_storage(self.hass)
-        tokens = await token_storage.async_load() or {}
-        tokens[STORAGE_REFRESH_TOKEN_KEY] = refresh_token
-        ccc_token = await send_device_login(access_token)
-        if ccc_token:
-            tokens[STORAGE_CCC_TOKEN_KEY] = ccc_token
-        else:
-            _LOGGER.error("New ccc token is none")
-        await token_storage.async_save(tokens)
-
         # Decode User ID from ID Token (the JWT payload)
         claims = decode_jwt_token(id_token)
         _LOGGER.error(f"[VIN DISCOVERY] JWT claims: {claims}")
         user_id = claims.get("snowflakeId")
         _LOGGER.error(f"[VIN DISCOVERY] Extracted user_id: {user_id}")
-        _LOGGER.error(f"[VIN DISCOVERY] CCC token exists: {ccc_token is not None}, length: {len(ccc_token) if ccc_token else 0}")
+        # Tokens are stored per account so several accounts never overwrite each other
+        self._account_id = get_account_id(claims)
+        if self._account_id is None:
+            _LOGGER.error("The ID token names no account, cannot store its tokens")
+            return self.async_abort(reason="missing_account_id")
+        token_storage = get_token_storage(self.hass, self._account_id)
+        tokens = await token_storage.async_load() or {}
+        tokens[STORAGE_REFRESH_TOKEN_KEY] = refresh_token
+        async with LynkCoHttpClient(account_id=self._account_id) as client:
+            ccc_token = await send_device_login(access_token, client)
+            if ccc_token:
+                tokens[STORAGE_CCC_TOKEN_KEY] = ccc_token
+                get_token_cache(self.hass, self._account_id).set_token(ccc_token)
+            else:
+                _LOGGER.error("New ccc token is none")
+            await token_storage.async_save(tokens)
+
+            _LOGGER.error(f"[VIN DISCOVERY] CCC token exists: {ccc_token is not None}, length: {len(ccc_token) if ccc_token else 0}")
 
-        # Retrieve VINs by querying the API
-        if not ccc_token:
-            _LOGGER.error("[VIN DISCOVERY] CCC token is None, cannot retrieve VINs")
-        if not user_id:
-            _LOGGER.error("[VIN DISCOVERY] User ID is None, cannot retrieve VINs")
+            # Retrieve VINs by querying the API
+            if not ccc_token:
+                _LOGGER.error("[VIN DISCOVERY] CCC token is None, cannot retrieve VINs")
+            if not user_id:
+                _LOGGER.error("[VIN DISCOVERY] User ID is None, cannot retrieve VINs")
 
-        vins = await get_user_vins(ccc_token, user_id) if ccc_token and user_id else []
-        _LOGGER.error(f"[VIN DISCOVERY] Retrieved VINs from API: {vins}")
+            vins = await get_user_vins(ccc_token, user_id, client) if ccc_token and user_id else []
+            _LOGGER.error(f"[VIN DISCOVERY] Retrieved VINs from API: {vins}")
 
         # If no VINs found, store tokens and show manual VIN entry form
         if not vins:
@@ -117,22 +145,20 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.context["tokens_stored"] = True
             return await self.async_step_manual_vin()
 
-        # For simplicity, we take the first VIN
-        vin = vins[0]
-
+        # Every vehicle of the account is managed by the same entry
         if hasattr(self, "_reauth_entry"):
             # Update the existing config entry
             self.hass.config_entries.async_update_entry(
                 self._reauth_entry,
-                data={CONFIG_VIN_KEY: vin},
+                data={CONFIG_VINS_KEY: vins, CONFIG_ACCOUNT_ID_KEY: self._account_id},
             )
             await self.hass.config_entries.async_reload(self._reauth_entry.entry_id)
             return self.async_abort(reason="reauth_successful")
 
         # Create new entry
         return self.async_create_entry(
-            title=f"Lynk & Co ({vin})",
-            data={CONFIG_VIN_KEY: vin},
+            title=entry_title(vins),
+            data={CONFIG_VINS_KEY: vins, CONFIG_ACCOUNT_ID_KEY: self._account_id},
             description_placeholders={
                 "additional_configuration": "Please use the configuration to enable experimental features."
             },
@@ -154,15 +180,21 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # Update the existing config entry
                     self.hass.config_entries.async_update_entry(
                         self._reauth_entry,
-                        data={CONFIG_VIN_KEY: vin},
+                        data={
+                            CONFIG_VINS_KEY: [vin],
+                            CONFIG_ACCOUNT_ID_KEY: self._account_id,
+                        },
                     )
                     await self.hass.config_entries.async_reload(self._reauth_entry.entry_id)
                     return self.async_abort(reason="reauth_successful")
 
                 # Create new entry with manually entered VIN
                 return self.async_create_entry(
-                    title=f"Lynk & Co ({vin})",
-                    data={CONFIG_VIN_KEY: vin},
+                    title=entry_title([vin]),
+                    data={
+                        CONFIG_VINS_KEY: [vin],
+                        CONFIG_ACCOUNT_ID_KEY: self._account_id,
+                    },
                     description_placeholders={
                         "additional_configuration": "Please use the configuration to enable experimental features."
                     },
@@ -335,9 +367,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self.config_entry = config_entry
 
     async def async_step_init(self, user_input=None) -> FlowResult:
+        errors = {}
         if user_input is not None:
-            # Save the options and conclude the options flow
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                parse_quiet_windows(user_input.get(CONFIG_QUIET_WINDOWS_KEY, ""))
+            except ValueError:
+                errors[CONFIG_QUIET_WINDOWS_KEY] = "invalid_quiet_windows"
+            else:
+                # Save the options and conclude the options flow
+                return self.async_create_entry(title="", data=user_input)
 
         data_schema = vol.Schema(
             {
@@ -353,6 +391,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONFIG_SCAN_INTERVAL_KEY, 120
                     ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=60, max=1440)),
+                vol.Required(
+                    CONFIG_SHADOW_SCAN_INTERVAL_KEY,
+                    default=self.config_entry.options.get(
+                        CONFIG_SHADOW_SCAN_INTERVAL_KEY, 30
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=1440)),
+                vol.Required(
+                    CONFIG_POLL_MIN_INTERVAL_KEY,
+                    default=self.config_entry.options.get(
+                        CONFIG_POLL_MIN_INTERVAL_KEY, 5
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                vol.Required(
+                    CONFIG_POLL_BACKOFF_FACTOR_KEY,
+                    default=self.config_entry.options.get(
+                        CONFIG_POLL_BACKOFF_FACTOR_KEY, 2.0
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=10.0)),
                 vol.Required(
                     CONFIG_DARK_HOURS_START,
                     default=self.config_entry.options.get(CONFIG_DARK_HOURS_START, 1),
@@ -361,6 +417,34 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONFIG_DARK_HOURS_END,
                     default=self.config_entry.options.get(CONFIG_DARK_HOURS_END, 5),
                 ): vol.All(vol.Coerce(int), vol.Range(min=0, max=23)),
+                vol.Optional(
+                    CONFIG_QUIET_WINDOWS_KEY,
+                    default=self.config_entry.options.get(CONFIG_QUIET_WINDOWS_KEY, ""),
+                ): str,
+                vol.Required(
+                    CONFIG_GEOCODE_MIN_DISTANCE_KEY,
+                    default=self.config_entry.options.get(
+                        CONFIG_GEOCODE_MIN_DISTANCE_KEY, 50
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+                vol.Required(
+                    CONFIG_COMMAND_PRECHECK_MAX_AGE_KEY,
+                    default=self.config_entry.options.get(
+                        CONFIG_COMMAND_PRECHECK_MAX_AGE_KEY, 5
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
+                vol.Required(
+                    CONFIG_DAILY_API_BUDGET_KEY,
+                    default=self.config_entry.options.get(
+                        CONFIG_DAILY_API_BUDGET_KEY, 2000
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=100, max=20000)),
+                vol.Optional(
+                    CONFIG_PAYLOAD_ALLOW_LIST_KEY,
+                    default=self.config_entry.options.get(
+                        CONFIG_PAYLOAD_ALLOW_LIST_KEY, ""
+                    ),
+                ): str,
             }
         )
 
@@ -368,4 +452,5 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         return self.async_show_form(
             step_id="init",
             data_schema=data_schema,
+            errors=errors,
         )
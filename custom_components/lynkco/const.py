@@ -1,11 +1,17 @@
 """Constants for the Lynk & Co integration."""
 
 DOMAIN = "lynkco"
-COORDINATOR = "coordinator"
+COORDINATORS = "coordinators"
 STORAGE_VERSION = 1
 STORAGE_TOKEN_KEY = "token_storage"
+STORAGE_TOKEN_CACHE_KEY = "token_cache"
+STORAGE_GEOCODE_CACHE_KEY = "geocode_cache"
+DATA_COMMAND_QUEUES = "command_queues"
+DATA_COMMAND_CONTEXTS = "command_contexts"
+DATA_RATE_LIMITERS = "rate_limiters"
 STORAGE_CCC_TOKEN_KEY = "ccc_token"
 STORAGE_USER_ID_KEY = "user_id"
+STORAGE_USER_IDS_KEY = "user_ids"
 STORAGE_REFRESH_TOKEN_KEY = "refresh_token"
 DATA_UPDATE_COORDINATOR = "data_update_coordinator"
 
@@ -16,17 +22,40 @@ CONFIG_LOGIN_METHOD_REDIRECT = "redirect_login"
 CONFIG_EMAIL_KEY = "email"
 CONFIG_PASSWORD_KEY = "password"
 CONFIG_VIN_KEY = "vin"
+CONFIG_VINS_KEY = "vins"
+CONFIG_ACCOUNT_ID_KEY = "account_id"
 CONFIG_2FA_KEY = "2fa"
 CONFIG_REDIRECT_URI_KEY = "redirect_uri"
 CONFIG_EXPERIMENTAL_KEY = "experimental"
 CONFIG_SCAN_INTERVAL_KEY = "scan_interval"
+CONFIG_SHADOW_SCAN_INTERVAL_KEY = "shadow_scan_interval"
+CONFIG_POLL_MIN_INTERVAL_KEY = "poll_min_interval"
+CONFIG_POLL_BACKOFF_FACTOR_KEY = "poll_backoff_factor"
 CONFIG_DARK_HOURS_START = "dark_hours_start"
 CONFIG_DARK_HOURS_END = "dark_hours_end"
+CONFIG_QUIET_WINDOWS_KEY = "quiet_windows"
+CONFIG_PAYLOAD_ALLOW_LIST_KEY = "payload_allow_list"
+CONFIG_GEOCODE_MIN_DISTANCE_KEY = "geocode_min_distance"
+CONFIG_COMMAND_PRECHECK_MAX_AGE_KEY = "command_precheck_max_age"
+CONFIG_DAILY_API_BUDGET_KEY = "daily_api_budget"
 
 # Hass data constants
 DATA_EXPECTED_STATE = "expected_state_monitor"
 DATA_IS_FORCE_UPDATE = "is_force_update"
-DATA_STORED_DATA = "stored_data"
+DATA_FORCED_REFRESHES = "forced_refreshes"
+DATA_SNAPSHOT_HISTORY = "snapshot_history"
+DATA_HTTP_CLIENT = "http_client"
+DATA_TOKEN_REFRESH = "token_refresh"
+DATA_POLL_SCHEDULERS = "poll_schedulers"
+DATA_SNAPSHOT_STORE = "snapshot_store"
+DATA_VEHICLES = "vehicles"
+DATA_POLL_SEMAPHORE = "poll_semaphore"
+DATA_QUIET_SCHEDULE = "quiet_schedule"
+
+# Data domains, each fetched by its own coordinator and used as the root of entity data paths
+DATA_RECORD_KEY = "vehicle_record"
+DATA_SHADOW_KEY = "vehicle_shadow"
+DATA_ADDRESS_KEY = "vehicle_address"
 
 # Service keys
 SERVICE_REFRESH_TOKENS_KEY = "refresh_tokens"
@@ -50,3 +79,43 @@ EXPECTED_STATE_ENGINE_ON = "engine_on"
 EXPECTED_STATE_ENGINE_OFF = "engine_off"
 EXPECTED_STATE_UNLOCKED = "unlocked"
 EXPECTED_STATE_LOCKED = "locked"
+OPPOSITE_EXPECTED_STATES = {
+    EXPECTED_STATE_ENGINE_ON: EXPECTED_STATE_ENGINE_OFF,
+    EXPECTED_STATE_ENGINE_OFF: EXPECTED_STATE_ENGINE_ON,
+    EXPECTED_STATE_UNLOCKED: EXPECTED_STATE_LOCKED,
+    EXPECTED_STATE_LOCKED: EXPECTED_STATE_UNLOCKED,
+    EXPECTED_STATE_CLIMATE_ON: EXPECTED_STATE_CLIMATE_OFF,
+    EXPECTED_STATE_CLIMATE_OFF: EXPECTED_STATE_CLIMATE_ON,
+}
+
+# Results reported by command services
+COMMAND_RESULT_SENT = "sent"
+COMMAND_RESULT_SKIPPED = "skipped"
+COMMAND_RESULT_CONFIRMED = "confirmed"
+COMMAND_RESULT_TIMED_OUT = "timed_out"
+COMMAND_RESULT_SUPERSEDED = "superseded"
+COMMAND_RESULT_FAILED = "failed"
+CONFIRMATION_TIMEOUT_SECONDS = 180
+
+# Vehicle data paths and values used to derive vehicle state
+ENGINE_STATUS_PATH = "vehicle_shadow.bvs.engineStatus"
+CHARGER_STATE_PATH = "vehicle_shadow.evs.chargerStatusData.chargerState"
+DOOR_LOCKS_STATUS_PATH = "vehicle_shadow.vls.doorLocksStatus"
+PRE_CLIMATE_ACTIVE_PATH = "vehicle_record.climate.preClimateActive"
+POSITION_LATITUDE_PATH = "vehicle_record.position.latitude"
+POSITION_LONGITUDE_PATH = "vehicle_record.position.longitude"
+# Paths read outside of entities: adaptive polling, command checks and address lookup
+INTERNAL_DATA_PATHS = frozenset(
+    {
+        ENGINE_STATUS_PATH,
+        CHARGER_STATE_PATH,
+        DOOR_LOCKS_STATUS_PATH,
+        PRE_CLIMATE_ACTIVE_PATH,
+        POSITION_LATITUDE_PATH,
+        POSITION_LONGITUDE_PATH,
+    }
+)
+ENGINE_RUNNING_STATES = {"ENGINE_RUNNING"}
+CHARGING_STATES = {"CHARGER_STATE_PRE_STRT", "CHARGER_STATE_CHARGN"}
+DOOR_LOCKS_LOCKED_STATES = {"DOOR_LOCKS_STATUS_LOCKED", "DOOR_LOCKS_STATUS_SAFE_LOCKED"}
+DOOR_LOCKS_UNLOCKED_STATES = {"DOOR_LOCKS_STATUS_UNLOCKED"}
@@ -0,0 +1,170 @@
+"""Update coordinators for the Lynk & Co data domains."""
+
+import time
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+_MISSING = object()
+
+
+def build_path_index(data):
+    """Flatten nested dicts into a dotted path -> value mapping.
+
+    Every node is indexed, not only the leaves, so a path to a sub-dict
+    resolves to that sub-dict just like walking the nested data would.
+    """
+    path_index = {}
+    pending = list(data.items()) if isinstance(data, dict) else []
+    while pending:
+        data_path, value = pending.pop()
+        path_index[data_path] = value
+        if isinstance(value, dict):
+            pending.extend((f"{data_path}.{key}", child) for key, child in value.items())
+    return path_index
+
+
+def prune_payload(data, data_key, data_paths):
+    """Return the payload of a data domain reduced to the subtrees at the given paths.
+
+    data_paths are full dotted paths starting with the data domain, paths of
+    other domains are ignored. None keeps the whole payload.
+    """
+    if data_paths is None or data_key in data_paths or not isinstance(data, dict):
+        return data
+    tree = {}
+    prefix = f"{data_key}."
+    for data_path in data_paths:
+        if not data_path.startswith(prefix):
+            continue
+        node = tree
+        *parents, leaf = data_path[len(prefix):].split(".")
+        for key in parents:
+            child = node.setdefault(key, {})
+            if child is True:
+                break
+            node = child
+        else:
+            # A whole subtree wins over paths below it
+            node[leaf] = True
+    return _project(data, tree)
+
+
+def _project(data, tree):
+    projected = {}
+    for key, subtree in tree.items():
+        if key not in data:
+            continue
+        if subtree is True:
+            projected[key] = data[key]
+        elif isinstance(data[key], dict):
+            child = _project(data[key], subtree)
+            if child:
+                projected[key] = child
+    return projected
+
+
+def _typed(value):
+    """Pair a value with its type so 1 and True, or 0 and False, compare unequal."""
+    return type(value), value
+
+
+def diff_path_indexes(previous_index, path_index):
+    """Return the paths that were added, removed or changed value or type.
+
+    The ancestors of a changed path are included too, since a dict compares
+    equal to one whose values only changed type.
+    """
+    changed_paths = {
+        data_path
+        for data_path in previous_index.keys() | path_index.keys()
+        if _typed(previous_index.get(data_path, _MISSING))
+        != _typed(path_index.get(data_path, _MISSING))
+    }
+    for data_path in list(changed_paths):
+        while "." in data_path:
+            data_path = data_path.rpartition(".")[0]
+            changed_paths.add(data_path)
+    return changed_paths
+
+
+class LynkCoDataUpdateCoordinator(DataUpdateCoordinator):
+    """Coordinator that indexes its data by dotted path once per update.
+
+    Entities pass the data paths they read as their coordinator context and
+    are only notified when one of those paths changed, or when the update
+    success state flipped.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._data = None
+        self._path_index = {}
+        self.data_generation = 0
+        # Time the data was last fetched from the backend, not reused or restored
+        self.fetched_at = None
+        self.changed_paths = set()
+        self._last_notified_success = True
+        super().__init__(*args, **kwargs)
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        previous_index = self._path_index
+        self._data = data
+        self._path_index = build_path_index(data)
+        self.changed_paths |= diff_path_indexes(previous_index, self._path_index)
+        self.data_generation += 1
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose data paths changed."""
+        changed_paths = self.changed_paths
+        self.changed_paths = set()
+        notify_all = self.last_update_success != self._last_notified_success
+        self._last_notified_success = self.last_update_success
+        for update_callback, context in list(self._listeners.values()):
+            if notify_all or context is None or not changed_paths.isdisjoint(context):
+                update_callback()
+
+    def registered_paths(self):
+        """Return the data paths of the listening entities.
+
+        None until an entity listens, or while a listener did not say which
+        paths it reads.
+        """
+        contexts = [context for _, context in self._listeners.values()]
+        if not contexts or None in contexts:
+            return None
+        return frozenset().union(*contexts)
+
+    def get_value(self, data_path, default=None):
+        """Return the value at a dotted data path."""
+        return self._path_index.get(data_path, default)
+
+    def has_path(self, data_path):
+        """Return True if the dotted data path is present in the current data."""
+        return data_path in self._path_index
+
+
+def get_data_key_for_path(coordinators, data_path):
+    """Return the data domain whose coordinator holds the given data path."""
+    for data_key in coordinators:
+        if data_path.startswith(data_key):
+            return data_key
+    raise ValueError(f"No coordinator provides data path {data_path}")
+
+
+def get_data_age(coordinators, data_keys):
+    """Return the seconds since the oldest fetch of the data domains, None if one was never fetched."""
+    fetched_at = [coordinators[data_key].fetched_at for data_key in data_keys]
+    if None in fetched_at:
+        return None
+    return time.time() - min(fetched_at)
+
+
+def get_coordinator_for_path(coordinators, data_path):
+    """Return the coordinator whose data holds the given data path."""
+    return coordinators[get_data_key_for_path(coordinators, data_path)]
@@ -1,6 +1,6 @@
-import aiohttp
 import logging
 
+from .rate_limiter import BudgetExhaustedError
 from .token_manager import get_ccc_token
 
 _LOGGER = logging.getLogger(__name__)
@@ -9,24 +9,24 @@ base_url = "https://vehicle-data-tls.aion.connectedcar.cloud/api/v1/vds/vehicles
 address_base_url = "https://geospatial-locator-tls.aion.connectedcar.cloud/geospatial-locator/api/geocoding/v1/position?"
 
 
-async def async_fetch_vehicle_address_data(hass, latitude, longitude):
+async def async_fetch_vehicle_address_data(hass, latitude, longitude, client):
     url = f"{address_base_url}latitude={latitude}&longitude={longitude}"
-    return await async_fetch_vehicle_data(hass, url)
+    return await async_fetch_vehicle_data(hass, url, client)
 
 
-async def async_fetch_vehicle_shadow_data(hass, vin):
+async def async_fetch_vehicle_shadow_data(hass, vin, client):
     url = f"{base_url}{vin}/data/shadow"
-    return await async_fetch_vehicle_data(hass, url)
+    return await async_fetch_vehicle_data(hass, url, client)
 
 
-async def async_fetch_vehicle_record_data(hass, vin):
+async def async_fetch_vehicle_record_data(hass, vin, client):
     url = f"{base_url}{vin}/data/record"
-    return await async_fetch_vehicle_data(hass, url)
+    return await async_fetch_vehicle_data(hass, url, client)
 
 
-async def async_fetch_vehicle_data(hass, url):
+async def async_fetch_vehicle_data(hass, url, client):
     """Fetch vehicle data using the CCC token."""
-    ccc_token = await get_ccc_token(hass)
+    ccc_token = await get_ccc_token(hass, client)
     if not ccc_token:
         _LOGGER.error("Failed to retrieve CCC token.")
         return None
@@ -37,18 +37,18 @@ async def async_fetch_vehicle_data(hass, url):
     }
 
     try:
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=False)
-        ) as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data
-                else:
-                    _LOGGER.error(
-                        f"Failed to fetch vehicle data, HTTP status: {response.status}, response: {await response.text()}"
-                    )
-                    return None
+        async with client.get(url, headers=headers) as response:
+            if response.status == 200:
+                data = await response.json()
+                return data
+            else:
+                _LOGGER.error(
+                    f"Failed to fetch vehicle data, HTTP status: {response.status}, response: {await response.text()}"
+                )
+                return None
+    except BudgetExhaustedError as error:
+        _LOGGER.warning("Skipping vehicle data fetch: %s", str(error))
+        return None
     except Exception as error:
         _LOGGER.error("Exception occurred while fetching vehicle data: %s", str(error))
         return None
@@ -5,24 +5,30 @@ from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import COORDINATOR, DOMAIN
+from .const import COORDINATORS, DATA_RECORD_KEY, DATA_VEHICLES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    vin = entry.data.get("vin")
-    async_add_entities([LynkCoDeviceTracker(coordinator, vin)])
+    vehicles = hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES]
+    async_add_entities(
+        [
+            LynkCoDeviceTracker(vehicle[COORDINATORS][DATA_RECORD_KEY], vin)
+            for vin, vehicle in vehicles.items()
+        ]
+    )
 
 
 class LynkCoDeviceTracker(CoordinatorEntity, TrackerEntity):
     def __init__(self, coordinator, vin):
-        super().__init__(coordinator)
+        self._data_path_long = "vehicle_record.position.longitude"
+        self._data_path_lat = "vehicle_record.position.latitude"
+        super().__init__(
+            coordinator, context=frozenset({self._data_path_lat, self._data_path_long})
+        )
         self.coordinator = coordinator
         self._vin = vin
-        self._data_path_long = "vehicle_record.position.longitude".split(".")
-        self._data_path_lat = "vehicle_record.position.latitude".split(".")
         self._attr_unique_id = f"{DOMAIN}_{self._vin}_location"
         self._attr_name = "Lynk & Co Vehicle Tracker"
 
@@ -34,20 +40,11 @@ class LynkCoDeviceTracker(CoordinatorEntity, TrackerEntity):
 
     @property
     def latitude(self):
-        return self._get_data_by_path(self._data_path_lat)
+        return self.coordinator.get_value(self._data_path_lat)
 
     @property
     def longitude(self):
-        return self._get_data_by_path(self._data_path_long)
-
-    def _get_data_by_path(self, path):
-        data = self.coordinator.data
-        for key in path:
-            if data is not None and key in data:
-                data = data[key]
-            else:
-                return None
-        return data
+        return self.coordinator.get_value(self._data_path_long)
 
     @property
     def source_type(self):
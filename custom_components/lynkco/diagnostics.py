@@ -0,0 +1,47 @@
+"""Diagnostics support for Lynk & Co."""
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONFIG_ACCOUNT_ID_KEY,
+    CONFIG_VIN_KEY,
+    CONFIG_VINS_KEY,
+    DATA_HTTP_CLIENT,
+    DATA_SNAPSHOT_HISTORY,
+    DATA_VEHICLES,
+    DOMAIN,
+)
+
+# The entry title holds the VIN of single vehicle entries
+TO_REDACT = {
+    CONFIG_ACCOUNT_ID_KEY,
+    CONFIG_VIN_KEY,
+    CONFIG_VINS_KEY,
+    "title",
+    "email",
+    "password",
+    "refresh_token",
+    "ccc_token",
+}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    client = entry_data[DATA_HTTP_CLIENT]
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "api_budget": client.rate_limiter.as_dict(),
+        "retries": client.retry_stats.as_dict(),
+        "circuit_breakers": {
+            host: circuit_breaker.as_dict()
+            for host, circuit_breaker in client.circuit_breakers.items()
+        },
+        # Listed in vehicle order so the VINs stay out of the diagnostics
+        "snapshots": [
+            vehicle[DATA_SNAPSHOT_HISTORY].as_dict()
+            for vehicle in entry_data[DATA_VEHICLES].values()
+        ],
+    }
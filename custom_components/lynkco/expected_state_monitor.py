@@ -2,109 +2,118 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 
-from custom_components.lynkco.remote_control_manager import force_update_data
+from custom_components.lynkco.remote_control_manager import (
+    EXPECTED_STATE_CHECKS,
+    force_update_data,
+    is_expected_state_reached,
+)
 
 from .const import (
-    COORDINATOR,
+    COMMAND_RESULT_CONFIRMED,
+    COMMAND_RESULT_FAILED,
+    COMMAND_RESULT_SUPERSEDED,
+    COMMAND_RESULT_TIMED_OUT,
+    CONFIRMATION_TIMEOUT_SECONDS,
+    COORDINATORS,
+    DATA_VEHICLES,
     DOMAIN,
-    EXPECTED_STATE_ENGINE_OFF,
-    EXPECTED_STATE_ENGINE_ON,
-    EXPECTED_STATE_UNLOCKED,
-    EXPECTED_STATE_LOCKED,
-    EXPECTED_STATE_CLIMATE_OFF,
-    EXPECTED_STATE_CLIMATE_ON,
+    OPPOSITE_EXPECTED_STATES,
 )
+from .coordinator import get_data_key_for_path
 
 
 _LOGGER = logging.getLogger(__name__)
 
+EXPECTED_STATE_TIMEOUT = timedelta(seconds=CONFIRMATION_TIMEOUT_SECONDS)
+
 
 class ExpectedStateMonitor:
-    def __init__(self):
+    def __init__(self, vin):
+        self.vin = vin
         self.expected_states = {}
+        # Expected state -> futures of callers waiting for its confirmation
+        self.waiters = {}
         self.loop_running = False
         self.lock = asyncio.Lock()
-        self.state_map = {
-            EXPECTED_STATE_ENGINE_ON: (
-                "binary_sensor.lynk_co_vehicle_is_running",
-                "on",
-            ),
-            EXPECTED_STATE_ENGINE_OFF: (
-                "binary_sensor.lynk_co_vehicle_is_running",
-                "off",
-            ),
-            EXPECTED_STATE_UNLOCKED: ("lock.lynk_co_locks", "unlocked"),
-            EXPECTED_STATE_LOCKED: ("lock.lynk_co_locks", "locked"),
-            EXPECTED_STATE_CLIMATE_ON: (
-                "binary_sensor.lynk_co_pre_climate_active",
-                "on",
-            ),
-            EXPECTED_STATE_CLIMATE_OFF: (
-                "binary_sensor.lynk_co_pre_climate_active",
-                "off",
-            ),
-        }
 
     async def expect_state(self, state, hass, entry):
-        """Expect a specific state to be reached and manage the monitoring loop."""
+        """Expect a specific state to be reached and manage the monitoring loop.
+
+        Returns a future resolved with the confirmation result once the state
+        is observed, superseded by its opposite or timed out.
+        """
         async with self.lock:
+            future = hass.loop.create_future()
             self.expected_states[state] = datetime.now()
+            self.waiters.setdefault(state, []).append(future)
             await self.remove_opposite(state)
             if not self.loop_running:
                 self.loop_running = True
                 asyncio.create_task(self.monitor_states(hass, entry))
+        return future
+
+    def resolve_waiters(self, state, result):
+        """Resolve every caller waiting for a state with the given result."""
+        for future in self.waiters.pop(state, []):
+            if not future.done():
+                future.set_result(result)
 
     async def remove_opposite(self, state):
         """Remove the opposite state if present."""
-        opposite_states = {
-            EXPECTED_STATE_ENGINE_ON: EXPECTED_STATE_ENGINE_OFF,
-            EXPECTED_STATE_ENGINE_OFF: EXPECTED_STATE_ENGINE_ON,
-            EXPECTED_STATE_UNLOCKED: EXPECTED_STATE_LOCKED,
-            EXPECTED_STATE_LOCKED: EXPECTED_STATE_UNLOCKED,
-            EXPECTED_STATE_CLIMATE_ON: EXPECTED_STATE_CLIMATE_OFF,
-            EXPECTED_STATE_CLIMATE_OFF: EXPECTED_STATE_CLIMATE_ON,
-        }
-
-        opposite_state = opposite_states.get(state)
+        opposite_state = OPPOSITE_EXPECTED_STATES.get(state)
         if opposite_state in self.expected_states:
             _LOGGER.info(f"Removing {opposite_state} since we are expecting {state}")
             del self.expected_states[opposite_state]
+            self.resolve_waiters(opposite_state, COMMAND_RESULT_SUPERSEDED)
+
+    def watched_data_keys(self, coordinators):
+        """Return the data domains holding the paths of the pending states."""
+        return {
+            get_data_key_for_path(coordinators, EXPECTED_STATE_CHECKS[state][0])
+            for state in self.expected_states
+        }
 
     async def monitor_states(self, hass, entry):
-        """Monitor expected states and update them continuously."""
+        """Poll only the endpoints holding the expected states until they are reached."""
         poll_time = 5
+        coordinators = hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES][self.vin][
+            COORDINATORS
+        ]
         try:
             while True:
                 await asyncio.sleep(poll_time)
-                await force_update_data(hass, entry)
-                coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-
                 async with self.lock:
-                    current_states = coordinator.data
-                    if self.check_and_update_states(current_states):
+                    data_keys = self.watched_data_keys(coordinators)
+                if data_keys:
+                    _LOGGER.debug(f"Confirmation poll of {sorted(data_keys)}")
+                    await force_update_data(hass, entry, self.vin, tuple(data_keys))
+                async with self.lock:
+                    if self.check_and_update_states(coordinators):
                         break
                 poll_time = min(30, poll_time + 10)
         finally:
             self.loop_running = False
+            # Only reached with states left if the loop itself failed
+            for state in list(self.waiters):
+                self.resolve_waiters(state, COMMAND_RESULT_FAILED)
 
-    def check_and_update_states(self, current_states):
+    def check_and_update_states(self, coordinators):
         """Check and update states based on current data. Return True if monitoring should stop."""
-        to_remove = []
+        to_remove = {}
         now = datetime.now()
         for state, timestamp in self.expected_states.items():
-            entity_id, expected_value = self.state_map[state]
-            actual_value = current_states.get(entity_id)
-            if actual_value == expected_value:
+            if is_expected_state_reached(coordinators, state):
                 _LOGGER.info(f"State {state} reached the expected value.")
-                to_remove.append(state)
-            elif (now - timestamp) > timedelta(minutes=3):
+                to_remove[state] = COMMAND_RESULT_CONFIRMED
+            elif (now - timestamp) > EXPECTED_STATE_TIMEOUT:
                 _LOGGER.info(
                     f"State {state} has not been reached within the expected time and will be removed."
                 )
-                to_remove.append(state)
+                to_remove[state] = COMMAND_RESULT_TIMED_OUT
 
-        for state in to_remove:
+        for state, result in to_remove.items():
             del self.expected_states[state]
+            self.resolve_waiters(state, result)
 
         return (
             not self.expected_states
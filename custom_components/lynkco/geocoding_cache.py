@@ -0,0 +1,174 @@
+"""Reverse geocoding cache keyed on quantized vehicle positions."""
+
+import asyncio
+from collections import OrderedDict
+import logging
+import math
+import time
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_GEOCODE_CACHE_KEY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Four decimals is roughly 11 m, finer than the accuracy of the reported position
+GEOCODE_KEY_PRECISION = 4
+GEOCODE_CACHE_MAX_ENTRIES = 256
+GEOCODE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+GEOCODE_CACHE_SAVE_DELAY_SECONDS = 30
+EARTH_RADIUS_METERS = 6371000
+
+
+def parse_address(address_response):
+    # Define the types of address components you are interested in
+    desired_types = {
+        "street_name": ["route", "street", "road"],  # Street name variations
+        "street_number": ["street_number"],  # Street number
+        "city": [
+            "postal_town",
+            "locality",
+            "administrative_area_level_2",
+        ],  # City variations
+    }
+
+    street_name, street_number, city = "", "", ""
+
+    for component in address_response["addressComponents"]:
+        for comp_type in component["types"]:
+            if comp_type in desired_types["street_name"]:
+                street_name = component["longName"]
+            elif comp_type in desired_types["street_number"]:
+                street_number = component["longName"]
+            elif comp_type in desired_types["city"]:
+                city = component["longName"]
+            if street_name or street_number or city:
+                break
+
+    street_address = f"{street_name} {street_number}".strip()
+    formatted_address = ", ".join(filter(None, [street_address, city]))
+
+    return formatted_address
+
+
+def parse_address_raw(address_response):
+    """Join all address components into a single string."""
+    return ", ".join(
+        component["longName"] for component in address_response["addressComponents"]
+    )
+
+
+def distance_meters(latitude_1, longitude_1, latitude_2, longitude_2):
+    """Return the haversine distance between two positions in meters."""
+    phi_1 = math.radians(latitude_1)
+    phi_2 = math.radians(latitude_2)
+    delta_phi = math.radians(latitude_2 - latitude_1)
+    delta_lambda = math.radians(longitude_2 - longitude_1)
+    a = (
+        math.sin(delta_phi / 2) ** 2
+        + math.cos(phi_1) * math.cos(phi_2) * math.sin(delta_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+
+
+def position_key(latitude, longitude):
+    """Quantize a position to the cache key precision."""
+    return (
+        f"{round(float(latitude), GEOCODE_KEY_PRECISION)},"
+        f"{round(float(longitude), GEOCODE_KEY_PRECISION)}"
+    )
+
+
+class GeocodeCache:
+    """LRU cache of resolved addresses, persisted across restarts."""
+
+    def __init__(self, hass):
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_geocode_cache")
+        self._entries = OrderedDict()
+        self._last_positions = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_get_address(self, vin, latitude, longitude, min_distance, fetch):
+        """Return (address, address_raw) for a position, calling fetch only on a miss.
+
+        The lookup is skipped entirely when the vehicle is within min_distance
+        meters of the last position resolved for it and that address has not
+        expired.
+        """
+        await self._async_load()
+        latitude = float(latitude)
+        longitude = float(longitude)
+
+        last = self._last_positions.get(vin)
+        if (
+            last is not None
+            and time.time() - last.get("created_at", 0) < GEOCODE_CACHE_TTL_SECONDS
+            and distance_meters(last["latitude"], last["longitude"], latitude, longitude)
+            <= min_distance
+        ):
+            _LOGGER.debug("Vehicle has not moved, reusing last address")
+            return last["address"], last["address_raw"]
+
+        key = position_key(latitude, longitude)
+        cached = self._entries.get(key)
+        if cached is not None and time.time() - cached["created_at"] < GEOCODE_CACHE_TTL_SECONDS:
+            _LOGGER.debug(f"Address cache hit for {key}")
+            self._entries.move_to_end(key)
+        else:
+            address_response = await fetch()
+            if not (
+                isinstance(address_response, dict)
+                and "addressComponents" in address_response
+            ):
+                _LOGGER.error("Failed to fetch vehicle address data.")
+                return None
+            cached = {
+                "address": parse_address(address_response),
+                "address_raw": parse_address_raw(address_response),
+                "created_at": time.time(),
+            }
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > GEOCODE_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+        self._last_positions[vin] = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "address": cached["address"],
+            "address_raw": cached["address_raw"],
+            "created_at": cached["created_at"],
+        }
+        self._store.async_delay_save(
+            self._data_to_save, GEOCODE_CACHE_SAVE_DELAY_SECONDS
+        )
+        return cached["address"], cached["address_raw"]
+
+    async def _async_load(self):
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load() or {}
+            now = time.time()
+            for key, cached in stored.get("entries", {}).items():
+                if now - cached.get("created_at", 0) < GEOCODE_CACHE_TTL_SECONDS:
+                    self._entries[key] = cached
+            self._last_positions = stored.get("last_positions", {})
+            self._loaded = True
+
+    def _data_to_save(self):
+        return {
+            "entries": dict(self._entries),
+            "last_positions": self._last_positions,
+        }
+
+
+def get_geocode_cache(hass):
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {}
+
+    if STORAGE_GEOCODE_CACHE_KEY not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][STORAGE_GEOCODE_CACHE_KEY] = GeocodeCache(hass)
+
+    return hass.data[DOMAIN][STORAGE_GEOCODE_CACHE_KEY]
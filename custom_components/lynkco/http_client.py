@@ -0,0 +1,221 @@
+"""Pooled HTTP transport shared by all cloud calls of a config entry."""
+
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from homeassistant.core import callback
+
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .rate_limiter import PRIORITY_BACKGROUND, BudgetExhaustedError
+from .retry_policy import RetryPolicy, RetryStats, parse_retry_after
+
+_LOGGER = logging.getLogger(__name__)
+
+# The integration only talks to a handful of aion/connectedcar hosts, so a small
+# pool with keep-alive is enough to avoid a new TCP/TLS handshake per request.
+CONNECTION_LIMIT = 20
+CONNECTION_LIMIT_PER_HOST = 4
+DNS_CACHE_TTL_SECONDS = 300
+KEEPALIVE_TIMEOUT_SECONDS = 60
+REQUEST_TIMEOUT_SECONDS = 30
+
+# Reads are idempotent and retried on any transient error
+READ_RETRY_POLICY = RetryPolicy(
+    "read",
+    max_attempts=4,
+    base_delay=1,
+    max_delay=20,
+    deadline=60,
+    retry_statuses={429, 500, 502, 503, 504},
+    retry_errors=(aiohttp.ClientError, asyncio.TimeoutError),
+)
+# Commands are only retried when the backend cannot have acted on them:
+# throttled or unavailable responses and connections that were never made
+COMMAND_RETRY_POLICY = RetryPolicy(
+    "command",
+    max_attempts=3,
+    base_delay=2,
+    max_delay=10,
+    deadline=30,
+    retry_statuses={429, 503},
+    retry_errors=(aiohttp.ClientConnectorError,),
+)
+
+
+class ClientClosedError(Exception):
+    """Raised instead of making a request once the client was closed."""
+
+
+class LynkCoHttpClient:
+    """Keep-alive HTTP client with per-host connection limits and DNS caching."""
+
+    def __init__(self, rate_limiter=None, account_id=None):
+        self._session: aiohttp.ClientSession | None = None
+        self._closed = False
+        self.rate_limiter = rate_limiter
+        # Account whose tokens authenticate the requests of this client
+        self.account_id = account_id
+        self.retry_stats = RetryStats()
+        self.circuit_breakers = {}
+        self._listeners = []
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use, until the client is closed."""
+        if self._closed:
+            raise ClientClosedError("HTTP client was closed")
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=False,
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+            )
+        return self._session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.async_close()
+
+    def get(self, url, retry_policy=READ_RETRY_POLICY, **kwargs):
+        """Perform a GET request on the pooled session, retried as a read by default."""
+        return self.request("GET", url, retry_policy, **kwargs)
+
+    def post(self, url, retry_policy=None, **kwargs):
+        """Perform a POST request on the pooled session, not retried by default."""
+        return self.request("POST", url, retry_policy, **kwargs)
+
+    def get_circuit_breaker(self, url):
+        """Return the circuit breaker of the host of a URL."""
+        host = urlsplit(url).hostname
+        if host not in self.circuit_breakers:
+            self.circuit_breakers[host] = CircuitBreaker(host, self._notify_listeners)
+        return self.circuit_breakers[host]
+
+    @callback
+    def async_add_listener(self, update_callback):
+        """Listen for circuit state changes, returning a function to stop."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def _notify_listeners(self):
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    async def _async_attempt(self, method, url, priority, **kwargs):
+        """Make one request through the rate limiter and circuit breaker of its host."""
+        session = self.session
+        circuit_breaker = self.get_circuit_breaker(url)
+        circuit_breaker.before_request()
+        if self.rate_limiter is not None:
+            try:
+                await self.rate_limiter.async_acquire(circuit_breaker.host, priority)
+            except BaseException:
+                circuit_breaker.record_cancelled()
+                raise
+        try:
+            response = await session.request(method, url, **kwargs)
+        except asyncio.CancelledError:
+            circuit_breaker.record_cancelled()
+            raise
+        except Exception:
+            circuit_breaker.record_failure()
+            raise
+        if response.status >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+        return response
+
+    @asynccontextmanager
+    async def request(
+        self, method, url, retry_policy=None, priority=PRIORITY_BACKGROUND, **kwargs
+    ):
+        """Perform a request, retrying it according to the retry policy.
+
+        Yields the first response that is not retried, or the last one once
+        the attempts or the deadline of the policy are used up. Retry-After
+        is honored on 429 and 503. Raises CircuitOpenError without a request
+        while the circuit of the host is open, and BudgetExhaustedError for
+        background requests once the daily budget is used up.
+        """
+        if retry_policy is None:
+            response = await self._async_attempt(method, url, priority, **kwargs)
+            try:
+                yield response
+            finally:
+                response.release()
+            return
+
+        started = time.monotonic()
+        attempt = 0
+        delays = []
+        while True:
+            attempt += 1
+            remaining = retry_policy.deadline - (time.monotonic() - started)
+            timeout = aiohttp.ClientTimeout(
+                total=max(1.0, min(REQUEST_TIMEOUT_SECONDS, remaining))
+            )
+            response = None
+            retry_after = None
+            try:
+                response = await self._async_attempt(
+                    method, url, priority, timeout=timeout, **kwargs
+                )
+            except retry_policy.retry_errors as error:
+                failure = error
+            except (CircuitOpenError, BudgetExhaustedError, ClientClosedError):
+                self.retry_stats.record(retry_policy.name, attempt, delays, False)
+                raise
+            else:
+                if response.status not in retry_policy.retry_statuses:
+                    break
+                failure = f"HTTP {response.status}"
+                if response.status in (429, 503):
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            delay = retry_policy.compute_delay(attempt, retry_after)
+            if (
+                attempt >= retry_policy.max_attempts
+                or time.monotonic() - started + delay >= retry_policy.deadline
+            ):
+                if response is not None:
+                    break
+                self.retry_stats.record(retry_policy.name, attempt, delays, False)
+                raise failure
+
+            if response is not None:
+                response.release()
+            _LOGGER.debug(
+                f"{method} {url} attempt {attempt} failed ({failure!r}), retrying in {delay:.1f} s"
+            )
+            delays.append(delay)
+            await asyncio.sleep(delay)
+
+        self.retry_stats.record(
+            retry_policy.name, attempt, delays, response.status < 400
+        )
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def async_close(self):
+        """Close the pooled session and all of its connections, for good."""
+        self._closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            _LOGGER.debug("Closed pooled HTTP session")
+        self._session = None
@@ -1,42 +1,71 @@
+from functools import partial
 import logging
 
 from homeassistant.components.lock import LockEntity
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import COORDINATOR, DOMAIN
-from .remote_control_manager import lock_doors, unlock_doors
+from .command_queue import get_command_queue
+from .const import (
+    COORDINATORS,
+    DATA_HTTP_CLIENT,
+    DATA_VEHICLES,
+    DOMAIN,
+    EXPECTED_STATE_LOCKED,
+    EXPECTED_STATE_UNLOCKED,
+    SERVICE_LOCK_DOORS_KEY,
+    SERVICE_UNLOCK_DOORS_KEY,
+)
+from .coordinator import get_coordinator_for_path
+from .remote_control_manager import is_command_redundant, lock_doors, unlock_doors
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    vin = entry.data.get("vin")
+    client = hass.data[DOMAIN][entry.entry_id][DATA_HTTP_CLIENT]
     async_add_entities(
         [
             LynkCoLock(
                 hass,
-                coordinator,
+                entry,
+                vehicle[COORDINATORS],
+                client,
                 vin,
                 "Lynk & Co Locks",
                 "vehicle_shadow.vls.doorLocksStatus",
-            ),
+            )
+            for vin, vehicle in hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES].items()
         ]
     )
 
 
 class LynkCoLock(CoordinatorEntity, LockEntity):
-    def __init__(self, hass, coordinator, vin, name, data_path, car_updated_at=None):
-        super().__init__(coordinator)
-        self._data_path = data_path.split(".")
+    def __init__(
+        self,
+        hass,
+        entry,
+        coordinators,
+        client,
+        vin,
+        name,
+        data_path,
+        car_updated_at=None,
+    ):
+        super().__init__(
+            get_coordinator_for_path(coordinators, data_path),
+            context=frozenset(filter(None, (data_path, car_updated_at))),
+        )
+        self._client = client
+        self._data_path = data_path
         self._hass = hass
+        self._entry = entry
         self._vin = vin
         self._name = name
         self._state = None
-        self._car_updated_at_path = (
-            car_updated_at.split(".") if car_updated_at else None
-        )
+        self._car_updated_at_path = car_updated_at
+        self._available = False
+        self._available_generation = None
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"lynk_co_{self._vin}")},
@@ -50,12 +79,9 @@ class LynkCoLock(CoordinatorEntity, LockEntity):
 
     @property
     def is_locked(self):
-        data = self.coordinator.data
-        for key in self._data_path:
-            if data is not None and key in data:
-                data = data[key]
-            else:
-                return None
+        data = self.coordinator.get_value(self._data_path)
+        if data is None:
+            return None
         return (
             data == "DOOR_LOCKS_STATUS_LOCKED"
             or data == "DOOR_LOCKS_STATUS_SAFE_LOCKED"
@@ -63,26 +89,40 @@ class LynkCoLock(CoordinatorEntity, LockEntity):
 
     async def async_lock(self, **kwargs):
         """Lock the vehicle."""
-        await lock_doors(self._hass, self._vin)
+        if is_command_redundant(self._hass, self._entry, self._vin, EXPECTED_STATE_LOCKED):
+            return
+        await get_command_queue(self._hass, self._vin).async_submit(
+            (SERVICE_LOCK_DOORS_KEY,),
+            partial(lock_doors, self._hass, self._vin, self._client),
+            EXPECTED_STATE_LOCKED,
+        )
 
     async def async_unlock(self, **kwargs):
         """Unlock the vehicle."""
-        await unlock_doors(self._hass, self._vin)
+        if is_command_redundant(self._hass, self._entry, self._vin, EXPECTED_STATE_UNLOCKED):
+            return
+        await get_command_queue(self._hass, self._vin).async_submit(
+            (SERVICE_UNLOCK_DOORS_KEY,),
+            partial(unlock_doors, self._hass, self._vin, self._client),
+            EXPECTED_STATE_UNLOCKED,
+        )
 
     @property
     def available(self):
-        if self.coordinator.data:
-            data = self.coordinator.data
-            for key in self._data_path:
-                if data is not None and key in data:
-                    data = data[key]
-                else:
+        # Resolved once per coordinator update, not on every state write
+        if self._available_generation != self.coordinator.data_generation:
+            self._available_generation = self.coordinator.data_generation
+            if self.coordinator.has_path(self._data_path):
+                self._available = (
+                    self.coordinator.get_value(self._data_path) != "NO_ENGINE_INFO"
+                )
+            else:
+                if self.coordinator.data:
                     _LOGGER.error(
                         f"Data path not found: {self._data_path}, coodinator.data: {self.coordinator.data}"
                     )
-                    return False
-            return data != "NO_ENGINE_INFO"
-        return False
+                self._available = False
+        return self._available
 
     @property
     def unique_id(self):
@@ -92,10 +132,7 @@ class LynkCoLock(CoordinatorEntity, LockEntity):
     def extra_state_attributes(self):
         attributes = {}
         if self._car_updated_at_path:
-            data = self.coordinator.data
-            for key in self._car_updated_at_path:
-                if data:
-                    data = data.get(key)
+            data = self.coordinator.get_value(self._car_updated_at_path)
             if data:
                 attributes["car_updated_at"] = data
         return attributes
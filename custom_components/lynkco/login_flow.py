@@ -360,7 +360,7 @@ async def getTokens(
     return None, None, None
 
 
-async def get_user_vins(ccc_token: str, user_id: str) -> list[str]:
+async def get_user_vins(ccc_token: str, user_id: str, client) -> list[str]:
     """Fetch a list of VINs associated with the logged in user."""
     url = f"{user_lifecycle_base_url}{user_id}/activevehicles"
     headers = {
@@ -373,13 +373,10 @@ async def get_user_vins(ccc_token: str, user_id: str) -> list[str]:
     _LOGGER.error(f"[VIN API] CCC token length: {len(ccc_token) if ccc_token else 0}")
 
     try:
-        async with (
-            aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session,
-            session.get(
-                url,
-                headers=headers,
-            ) as response,
-        ):
+        async with client.get(
+            url,
+            headers=headers,
+        ) as response:
             _LOGGER.error(f"[VIN API] Response status: {response.status}")
             response_text = await response.text()
             _LOGGER.error(f"[VIN API] Response body: {response_text}")
@@ -0,0 +1,136 @@
+"""Adaptive poll interval driven by the last known vehicle state."""
+
+from datetime import timedelta
+import hashlib
+import logging
+import random
+import time
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CHARGER_STATE_PATH,
+    CHARGING_STATES,
+    DOOR_LOCKS_LOCKED_STATES,
+    DOOR_LOCKS_STATUS_PATH,
+    ENGINE_RUNNING_STATES,
+    ENGINE_STATUS_PATH,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Random delay added to every poll, as a share of the interval and at most
+POLL_JITTER_FRACTION = 0.05
+POLL_MAX_JITTER_SECONDS = 60
+# Refreshes after a restart are spread over this window by their phase
+STARTUP_RAMP_SECONDS = 120
+STARTUP_JITTER_SECONDS = 10
+
+
+def get_value_by_path(data, data_path):
+    """Walk a dotted data path, returning None if any key is missing."""
+    for key in data_path.split("."):
+        if isinstance(data, dict) and key in data:
+            data = data[key]
+        else:
+            return None
+    return data
+
+
+def poll_phase(entry_id, vehicle_index, vehicle_count, domain_index=0, domain_count=1):
+    """Return a fixed offset in [0, 1) of the poll interval for a vehicle and data domain.
+
+    A hash of the entry places each entry at its own offset, its vehicles are
+    spread evenly from there and the data domains of one vehicle evenly over
+    its share of the interval.
+    """
+    digest = hashlib.sha256(entry_id.encode()).digest()
+    entry_phase = int.from_bytes(digest[:8], "big") / 2**64
+    return (entry_phase + (vehicle_index + domain_index / domain_count) / vehicle_count) % 1
+
+
+def is_vehicle_active(stored_data):
+    """Return True while the vehicle is driving or charging."""
+    return (
+        get_value_by_path(stored_data, ENGINE_STATUS_PATH) in ENGINE_RUNNING_STATES
+        or get_value_by_path(stored_data, CHARGER_STATE_PATH) in CHARGING_STATES
+    )
+
+
+def is_vehicle_locked(stored_data):
+    """Return True if the doors were reported locked."""
+    return get_value_by_path(stored_data, DOOR_LOCKS_STATUS_PATH) in DOOR_LOCKS_LOCKED_STATES
+
+
+class AdaptivePollScheduler:
+    """Pick the next poll delay of a coordinator from the last vehicle state.
+
+    Polls run at the minimum interval while the vehicle is driving or charging.
+    Every poll that finds it parked and locked multiplies the delay by the
+    backoff factor, up to the maximum interval. An unlocked, parked vehicle
+    keeps the current delay since it is likely about to be used. Until the
+    first poll the state is unknown and the maximum interval is used.
+
+    Polls land on a fixed phase of the interval, see poll_phase, plus a small
+    jitter, so vehicles and entries do not poll the backend in lockstep. A
+    poll that would fall in a quiet window is moved past its end, ramped in
+    like the refreshes after a restart.
+    """
+
+    def __init__(
+        self, min_interval_minutes, max_interval_minutes, backoff_factor, phase=0.0
+    ):
+        self.update_settings(min_interval_minutes, max_interval_minutes, backoff_factor)
+        self._interval_minutes = self._max_interval_minutes
+        self._phase = phase
+
+    def update_settings(self, min_interval_minutes, max_interval_minutes, backoff_factor):
+        """Apply new bounds and backoff factor."""
+        self._min_interval_minutes = min_interval_minutes
+        self._max_interval_minutes = max(min_interval_minutes, max_interval_minutes)
+        self._backoff_factor = max(1.0, backoff_factor)
+
+    @property
+    def max_interval(self) -> timedelta:
+        """Return the longest delay between two polls."""
+        return timedelta(minutes=self._max_interval_minutes)
+
+    def next_interval(self, stored_data, quiet_schedule=None) -> timedelta:
+        """Return the delay until the next poll."""
+        if is_vehicle_active(stored_data):
+            self._interval_minutes = self._min_interval_minutes
+        elif is_vehicle_locked(stored_data):
+            self._interval_minutes *= self._backoff_factor
+        self._interval_minutes = min(
+            self._max_interval_minutes,
+            max(self._min_interval_minutes, self._interval_minutes),
+        )
+        delay = self._phased_delay(self._interval_minutes * 60)
+        if quiet_schedule is None:
+            return delay
+        now = dt_util.now()
+        allowed_at = quiet_schedule.next_allowed(now + delay)
+        if allowed_at == now + delay:
+            return delay
+        _LOGGER.debug(f"Next poll deferred to the end of the quiet window at {allowed_at}")
+        return allowed_at - now + timedelta(seconds=self.startup_delay())
+
+    def startup_delay(self):
+        """Return the delay in seconds of the first refresh after a restart."""
+        return self._phase * STARTUP_RAMP_SECONDS + random.uniform(
+            0, STARTUP_JITTER_SECONDS
+        )
+
+    def _phased_delay(self, interval_seconds):
+        """Return the delay until the next phase point plus jitter.
+
+        The phase point lies in (0, interval] and is kept at least the minimum
+        interval away; the jitter comes on top of it.
+        """
+        delay = (self._phase * interval_seconds - time.time()) % interval_seconds
+        delay = max(self._min_interval_minutes * 60, delay or interval_seconds)
+        delay += random.uniform(
+            0, min(POLL_MAX_JITTER_SECONDS, interval_seconds * POLL_JITTER_FRACTION)
+        )
+        _LOGGER.debug(f"Next poll in {delay / 60:.1f} min")
+        return timedelta(seconds=delay)
@@ -0,0 +1,86 @@
+"""Weekly quiet windows during which the vehicles are not polled."""
+
+from datetime import datetime, time, timedelta
+import re
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+# Guards against windows chained back to back over the whole week
+MAX_CHAINED_WINDOWS = 16
+
+_WINDOW_PATTERN = re.compile(
+    r"^(?P<days>[a-z,\-*]+)\s+(?P<start>\d{1,2}:\d{2})\s*-\s*(?P<end>\d{1,2}:\d{2})$"
+)
+
+
+def _parse_minutes(value):
+    hours, minutes = (int(part) for part in value.split(":"))
+    if hours > 23 or minutes > 59:
+        raise ValueError(f"Invalid time {value}")
+    return hours * 60 + minutes
+
+
+def _parse_days(value):
+    if value in ("*", "daily"):
+        return set(range(7))
+    days = set()
+    for part in value.split(","):
+        first, _, last = part.partition("-")
+        if first not in WEEKDAYS or (last and last not in WEEKDAYS):
+            raise ValueError(f"Invalid weekday {part}")
+        start = WEEKDAYS.index(first)
+        end = WEEKDAYS.index(last) if last else start
+        days.update(day % 7 for day in range(start, start + (end - start) % 7 + 1))
+    return days
+
+
+def parse_quiet_windows(spec):
+    """Parse windows like "mon-fri 22:30-06:00; sat,sun 00:00-08:00".
+
+    Returns (weekday, start minute, duration in minutes) tuples, Monday being
+    0. A window ending at or before its start ends on the next day. Raises
+    ValueError on an invalid spec.
+    """
+    windows = []
+    for part in filter(None, (part.strip().lower() for part in (spec or "").split(";"))):
+        match = _WINDOW_PATTERN.match(part)
+        if match is None:
+            raise ValueError(f"Invalid quiet window {part}")
+        start = _parse_minutes(match["start"])
+        duration = (_parse_minutes(match["end"]) - start) % (24 * 60) or 24 * 60
+        windows.extend((day, start, duration) for day in _parse_days(match["days"]))
+    return windows
+
+
+class QuietSchedule:
+    """Answer when automatic polls are allowed again."""
+
+    def __init__(self, windows):
+        self._windows = {}
+        for weekday, start, duration in windows:
+            self._windows.setdefault(weekday, []).append((start, duration))
+
+    def _window_end(self, moment):
+        """Return the latest end of the windows covering a moment, None if not quiet."""
+        window_end = None
+        for days_back in (0, 1):
+            day = moment.date() - timedelta(days=days_back)
+            midnight = datetime.combine(day, time(), tzinfo=moment.tzinfo)
+            for start, duration in self._windows.get(day.weekday(), ()):
+                start_at = midnight + timedelta(minutes=start)
+                end_at = start_at + timedelta(minutes=duration)
+                if start_at <= moment < end_at and (window_end is None or end_at > window_end):
+                    window_end = end_at
+        return window_end
+
+    def is_quiet(self, moment):
+        """Return True if a moment falls in a quiet window."""
+        return self._window_end(moment) is not None
+
+    def next_allowed(self, moment):
+        """Return the moment itself if polling is allowed, else the end of its quiet windows."""
+        for _ in range(MAX_CHAINED_WINDOWS):
+            window_end = self._window_end(moment)
+            if window_end is None:
+                break
+            moment = window_end
+        return moment
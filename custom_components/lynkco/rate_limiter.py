@@ -0,0 +1,163 @@
+"""Request rate limiting and daily call budget of one Lynk & Co account."""
+
+import asyncio
+from collections import Counter
+import logging
+import time
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_RATE_LIMITERS, DOMAIN, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower values are served first, only background requests count against the budget
+PRIORITY_AUTH = 0
+PRIORITY_COMMAND = 1
+PRIORITY_BACKGROUND = 2
+
+# Sustained rate and burst size of the requests to a single host
+RATE_LIMIT_PER_MINUTE = 30
+RATE_LIMIT_BURST = 10
+BUDGET_SAVE_DELAY_SECONDS = 60
+
+
+class BudgetExhaustedError(Exception):
+    """Raised instead of a background request once the daily budget is used up."""
+
+
+class TokenBucket:
+    """Token bucket serving waiting requests of a higher priority first."""
+
+    def __init__(self, rate_per_minute, burst):
+        self._rate = rate_per_minute / 60
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._waiting = Counter()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    async def async_acquire(self, priority):
+        """Wait until a request may be made."""
+        self._waiting[priority] += 1
+        try:
+            while True:
+                self._refill()
+                if self._tokens >= 1 and not any(
+                    count for waiting, count in self._waiting.items() if waiting < priority
+                ):
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(max(0.1, (1 - self._tokens) / self._rate))
+        finally:
+            self._waiting[priority] -= 1
+
+
+class ApiRateLimiter:
+    """Token bucket per host plus a daily budget for background requests.
+
+    Scheduled polls, forced updates and confirmation polls all count against
+    the budget, commands and token requests do not. The used count is stored
+    so restarts do not reset it.
+    """
+
+    def __init__(self, hass, storage_key, daily_budget):
+        self.daily_budget = daily_budget
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_api_budget_{storage_key}")
+        self._buckets = {}
+        self._day = None
+        self._used = 0
+        self._listeners = []
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self):
+        """Restore the used budget of today, once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load() or {}
+            self._day = stored.get("day")
+            self._used = stored.get("used", 0)
+            self._roll_over()
+            self._loaded = True
+
+    async def async_remove(self):
+        """Remove the stored budget."""
+        await self._store.async_remove()
+
+    @property
+    def used(self):
+        self._roll_over()
+        return self._used
+
+    @property
+    def remaining(self):
+        return max(0, self.daily_budget - self.used)
+
+    async def async_acquire(self, host, priority):
+        """Wait for the rate limit of a host, raising BudgetExhaustedError if out of budget."""
+        if priority == PRIORITY_BACKGROUND:
+            if self.remaining <= 0:
+                raise BudgetExhaustedError(
+                    f"Daily budget of {self.daily_budget} requests used up"
+                )
+            self._used += 1
+            self._store.async_delay_save(self._data_to_save, BUDGET_SAVE_DELAY_SECONDS)
+            self._notify_listeners()
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST)
+        await self._buckets[host].async_acquire(priority)
+
+    def async_add_listener(self, update_callback):
+        """Listen for budget changes, returning a function to stop."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def _notify_listeners(self):
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def _roll_over(self):
+        today = dt_util.now().date().isoformat()
+        if self._day != today:
+            if self._day is not None:
+                _LOGGER.debug(f"Used {self._used} requests of the budget on {self._day}")
+            self._day = today
+            self._used = 0
+
+    def _data_to_save(self):
+        return {"day": self._day, "used": self._used}
+
+    def as_dict(self):
+        return {
+            "daily_budget": self.daily_budget,
+            "used": self.used,
+            "remaining": self.remaining,
+        }
+
+
+async def async_get_rate_limiter(hass, account_id, daily_budget):
+    """Return the loaded rate limiter shared by the entries of an account."""
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {}
+
+    rate_limiters = hass.data[DOMAIN].setdefault(DATA_RATE_LIMITERS, {})
+    if account_id not in rate_limiters:
+        rate_limiters[account_id] = ApiRateLimiter(hass, account_id, daily_budget)
+
+    rate_limiter = rate_limiters[account_id]
+    rate_limiter.daily_budget = daily_budget
+    await rate_limiter.async_load()
+    return rate_limiter
+
+
+async def async_remove_rate_limiter(hass, account_id):
+    """Remove the stored and cached budget of an account."""
+    await ApiRateLimiter(hass, account_id, 0).async_remove()
+    hass.data[DOMAIN].get(DATA_RATE_LIMITERS, {}).pop(account_id, None)
@@ -1,43 +1,206 @@
+import asyncio
+from functools import partial
 import logging
+import time
 
 from .const import (
-    COORDINATOR,
+    CONFIG_COMMAND_PRECHECK_MAX_AGE_KEY,
+    COORDINATORS,
+    DATA_COMMAND_CONTEXTS,
+    DATA_EXPECTED_STATE,
+    DATA_FORCED_REFRESHES,
     DATA_IS_FORCE_UPDATE,
+    DATA_RECORD_KEY,
+    DATA_SHADOW_KEY,
+    DATA_VEHICLES,
     DOMAIN,
+    DOOR_LOCKS_LOCKED_STATES,
+    DOOR_LOCKS_STATUS_PATH,
+    DOOR_LOCKS_UNLOCKED_STATES,
+    ENGINE_RUNNING_STATES,
+    ENGINE_STATUS_PATH,
+    EXPECTED_STATE_CLIMATE_OFF,
+    EXPECTED_STATE_CLIMATE_ON,
+    EXPECTED_STATE_ENGINE_OFF,
+    EXPECTED_STATE_ENGINE_ON,
+    EXPECTED_STATE_LOCKED,
+    EXPECTED_STATE_UNLOCKED,
+    OPPOSITE_EXPECTED_STATES,
+    PRE_CLIMATE_ACTIVE_PATH,
 )
-import aiohttp
-
+from .command_queue import get_command_queue
+from .coordinator import get_coordinator_for_path
+from .http_client import COMMAND_RETRY_POLICY
+from .rate_limiter import PRIORITY_COMMAND
 from .token_manager import get_ccc_token, get_user_id
 
 _LOGGER = logging.getLogger(__name__)
 
+# Forced updates requested within this window share one backend call,
+# matching the cooldown of the coordinator debouncers
+FORCE_UPDATE_MERGE_SECONDS = 10
 
-async def make_http_request(hass, url, data, vin):
-    ccc_token = await get_ccc_token(hass)
-    user_id = await get_user_id(hass, ccc_token, vin)
-    headers = {
-        "user-agent": "LynkCo/3016 CFNetwork/1492.0.1 Darwin/23.3.0",
-        "accept": "application/json",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "userId": user_id,
-        "X-B3-TraceId": "2d3c260f81d6c8e9548d1ddd3db2d482",
-        "Authorization": f"Bearer {ccc_token}",
-    }
-    async with aiohttp.ClientSession(
-        connector=aiohttp.TCPConnector(ssl=False)
-    ) as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status == 200:
-                return True
-            else:
-                _LOGGER.error(
-                    f"Failed to execute command, HTTP status: {response.status}, response: {await response.text()}"
-                )
-                return False
-
-
-async def start_climate(hass, vin, climate_level, duration_in_minutes):
+# Expected state -> (data path holding it, check on the reported value).
+# None means the path is not reported yet and never matches.
+EXPECTED_STATE_CHECKS = {
+    EXPECTED_STATE_ENGINE_ON: (
+        ENGINE_STATUS_PATH,
+        lambda value: value in ENGINE_RUNNING_STATES,
+    ),
+    EXPECTED_STATE_ENGINE_OFF: (
+        ENGINE_STATUS_PATH,
+        lambda value: value == "ENGINE_OFF",
+    ),
+    EXPECTED_STATE_UNLOCKED: (
+        DOOR_LOCKS_STATUS_PATH,
+        lambda value: value in DOOR_LOCKS_UNLOCKED_STATES,
+    ),
+    EXPECTED_STATE_LOCKED: (
+        DOOR_LOCKS_STATUS_PATH,
+        lambda value: value in DOOR_LOCKS_LOCKED_STATES,
+    ),
+    EXPECTED_STATE_CLIMATE_ON: (
+        PRE_CLIMATE_ACTIVE_PATH,
+        lambda value: value is not None and bool(value),
+    ),
+    EXPECTED_STATE_CLIMATE_OFF: (
+        PRE_CLIMATE_ACTIVE_PATH,
+        lambda value: value is not None and not value,
+    ),
+}
+
+# Commands that are not sent when fresh data already shows their expected state.
+# Starting climate or the engine is always sent since it also changes the settings.
+PRECHECKED_STATES = {
+    EXPECTED_STATE_LOCKED,
+    EXPECTED_STATE_UNLOCKED,
+    EXPECTED_STATE_CLIMATE_OFF,
+    EXPECTED_STATE_ENGINE_OFF,
+}
+
+
+def is_expected_state_reached(coordinators, expected_state):
+    """Return True if the current data shows the expected state."""
+    data_path, is_reached = EXPECTED_STATE_CHECKS[expected_state]
+    return is_reached(get_coordinator_for_path(coordinators, data_path).get_value(data_path))
+
+
+def is_command_redundant(hass, entry, vin, expected_state):
+    """Return True if recently fetched data already shows the state a command would reach.
+
+    Never True while an opposite command is queued, in flight or awaiting
+    confirmation, since the data then no longer shows where the vehicle ends up.
+    """
+    max_age_minutes = entry.options.get(CONFIG_COMMAND_PRECHECK_MAX_AGE_KEY, 5)
+    if expected_state not in PRECHECKED_STATES or max_age_minutes <= 0:
+        return False
+    vehicle = hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES][vin]
+    opposite_state = OPPOSITE_EXPECTED_STATES.get(expected_state)
+    if opposite_state is not None and (
+        get_command_queue(hass, vin).has_pending_state(opposite_state)
+        or opposite_state in vehicle[DATA_EXPECTED_STATE].expected_states
+    ):
+        return False
+    coordinators = vehicle[COORDINATORS]
+    data_path = EXPECTED_STATE_CHECKS[expected_state][0]
+    fetched_at = get_coordinator_for_path(coordinators, data_path).fetched_at
+    if fetched_at is None or time.time() - fetched_at > max_age_minutes * 60:
+        return False
+    if not is_expected_state_reached(coordinators, expected_state):
+        return False
+    _LOGGER.info(f"Vehicle {vin} already reports {expected_state}, not sending the command")
+    return True
+
+
+# Headers shared by all commands, completed with the user ID and token per vehicle
+COMMAND_HEADERS = {
+    "user-agent": "LynkCo/3016 CFNetwork/1492.0.1 Darwin/23.3.0",
+    "accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "X-B3-TraceId": "2d3c260f81d6c8e9548d1ddd3db2d482",
+}
+
+
+class CommandContext:
+    """User ID, token and prebuilt headers used for the commands of one vehicle.
+
+    The user ID is resolved once and the headers are rebuilt only when the
+    cached CCC token changed, so a command normally costs a single request
+    without any storage reads.
+    """
+
+    def __init__(self, vin):
+        self.vin = vin
+        self.user_id = None
+        self.user_id_stale = False
+        self.token = None
+        self.headers = None
+
+    async def async_get_headers(self, hass, client):
+        """Return the request headers, rebuilding them after a token refresh."""
+        token = await get_ccc_token(hass, client)
+        if self.user_id is None:
+            self.user_id = await get_user_id(
+                hass, token, self.vin, client, PRIORITY_COMMAND, self.user_id_stale
+            )
+            self.user_id_stale = False
+            self.headers = None
+        if self.headers is None or token != self.token:
+            self.token = token
+            self.headers = {
+                **COMMAND_HEADERS,
+                "userId": self.user_id,
+                "Authorization": f"Bearer {token}",
+            }
+        return self.headers
+
+    def invalidate(self):
+        """Drop the resolved values so the next command resolves them again.
+
+        The stored user ID is looked up again as well, it may be what the
+        backend rejected.
+        """
+        self.user_id = None
+        self.user_id_stale = True
+        self.token = None
+        self.headers = None
+
+
+def get_command_context(hass, vin):
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {}
+
+    command_contexts = hass.data[DOMAIN].setdefault(DATA_COMMAND_CONTEXTS, {})
+    if vin not in command_contexts:
+        command_contexts[vin] = CommandContext(vin)
+
+    return command_contexts[vin]
+
+
+async def make_http_request(hass, url, data, vin, client):
+    command_context = get_command_context(hass, vin)
+    headers = await command_context.async_get_headers(hass, client)
+    async with client.post(
+        url,
+        retry_policy=COMMAND_RETRY_POLICY,
+        priority=PRIORITY_COMMAND,
+        headers=headers,
+        json=data,
+    ) as response:
+        if response.status == 200:
+            return True
+        else:
+            if response.status in (401, 403):
+                # Stale user ID or token, resolve them again on the next command
+                command_context.invalidate()
+            _LOGGER.error(
+                f"Failed to execute command, HTTP status: {response.status}, response: {await response.text()}"
+            )
+            return False
+
+
+async def start_climate(hass, vin, climate_level, duration_in_minutes, client):
     data = {
         "climateLevel": climate_level,
         "command": "START",
@@ -49,16 +212,19 @@ async def start_climate(hass, vin, climate_level, duration_in_minutes):
         "timerId": "1",
         "ventilationItems": ["ALL"],
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/climate",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent start climate to Lynk backend")
+    return sent
 
 
-async def stop_climate(hass, vin):
+async def stop_climate(hass, vin, client):
     data = {
         "command": "STOP",
         "dayofweek": ["ONCE"],
@@ -68,44 +234,53 @@ async def stop_climate(hass, vin):
         "ventilationItems": ["ALL"],
         "scheduledTime": 10,
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/climate",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent stop climate to Lynk backend")
+    return sent
 
 
-async def start_engine(hass, vin, duration_in_minutes):
+async def start_engine(hass, vin, duration_in_minutes, client):
     data = {
         "command": "START",
         "durationInSeconds": duration_in_minutes * 60,
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/engine",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent start engine to Lynk backend")
+    return sent
 
 
-async def stop_engine(hass, vin):
+async def stop_engine(hass, vin, client):
     data = {
         "command": "STOP",
         "durationInSeconds": 1800,
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/engine",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent stop engine to Lynk backend")
+    return sent
 
 
-async def lock_doors(hass, vin):
+async def lock_doors(hass, vin, client):
     data = {
         "doorItems": ["ALL_DOORS"],
         "targetItems": [
@@ -116,16 +291,19 @@ async def lock_doors(hass, vin):
             "FRONT_CHARGE_LID",
         ],
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/doorlock",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent lock doors to Lynk backend")
+    return sent
 
 
-async def unlock_doors(hass, vin):
+async def unlock_doors(hass, vin, client):
     data = {
         "doorItems": ["ALL_DOORS"],
         "targetItems": [
@@ -135,87 +313,142 @@ async def unlock_doors(hass, vin):
         "durationInSeconds": 15,
         "timeStart": 0,
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/doorunlock",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent unlock doors to Lynk backend")
+    return sent
 
 
-async def start_flash_lights(hass, vin):
+async def start_flash_lights(hass, vin, client):
     data = {
         "command": "START",
         "control": "FLASH",
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/honkflash",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent start flash to Lynk backend")
+    return sent
 
 
-async def start_honk(hass, vin):
+async def start_honk(hass, vin, client):
     data = {
         "command": "START",
         "control": "HONK",
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/honkflash",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent start honk to Lynk backend")
+    return sent
 
 
-async def start_honk_flash(hass, vin):
+async def start_honk_flash(hass, vin, client):
     data = {
         "command": "START",
         "control": "HONK_FLASH",
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/honkflash",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent start honk and flash to Lynk backend")
+    return sent
 
 
-async def stop_flash_lights(hass, vin):
+async def stop_flash_lights(hass, vin, client):
     data = {
         "command": "STOP",
         "control": "FLASH",
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/honkflash",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent stop flash to Lynk backend")
+    return sent
 
 
-async def stop_honk(hass, vin):
+async def stop_honk(hass, vin, client):
     data = {
         "command": "STOP",
         "control": "HONK",
     }
-    if await make_http_request(
+    sent = await make_http_request(
         hass,
         f"https://remote-vehicle-control-tls.aion.connectedcar.cloud/api/v1/rvc/vehicles/{vin}/remotecontrol/honkflash",
         data,
         vin,
-    ):
+        client,
+    )
+    if sent:
         _LOGGER.info("Successfully sent stop honk to Lynk backend")
+    return sent
+
+
+def start_force_update(hass, entry, vin, data_keys=(DATA_RECORD_KEY, DATA_SHADOW_KEY)):
+    """Start a forced data update of a vehicle, bypassing the quiet windows.
+
+    Returns the refresh task per data domain. A forced refresh of a domain
+    that is still running, or finished less than FORCE_UPDATE_MERGE_SECONDS
+    ago, is shared instead of starting another backend call.
+    """
+    vehicle = hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES][vin]
+    forced_refreshes = vehicle[DATA_FORCED_REFRESHES]
+    tasks = []
+    for data_key in data_keys:
+        finished_at, task = forced_refreshes.get(data_key, (None, None))
+        if task is None or (
+            finished_at is not None
+            and time.monotonic() - finished_at > FORCE_UPDATE_MERGE_SECONDS
+        ):
+            vehicle[DATA_IS_FORCE_UPDATE].add(data_key)
+            task = hass.async_create_task(vehicle[COORDINATORS][data_key].async_refresh())
+            forced_refreshes[data_key] = (None, task)
+            task.add_done_callback(partial(_record_finished, forced_refreshes, data_key))
+        else:
+            _LOGGER.debug(f"Joining the forced {data_key} refresh of {vin}")
+        tasks.append(task)
+    return tasks
+
+
+def _record_finished(forced_refreshes, data_key, task):
+    """Stamp when a forced refresh finished, the merge window starts there."""
+    if forced_refreshes.get(data_key, (None, None))[1] is task:
+        forced_refreshes[data_key] = (time.monotonic(), task)
 
 
-async def force_update_data(hass, entry):
-    """Trigger a force data update, bypassing the nightly time check."""
-    hass.data[DOMAIN][entry.entry_id][DATA_IS_FORCE_UPDATE] = True
-    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    await coordinator.async_request_refresh()
+async def force_update_data(
+    hass, entry, vin, data_keys=(DATA_RECORD_KEY, DATA_SHADOW_KEY)
+):
+    """Force a data update of a vehicle and wait for it to finish."""
+    await asyncio.gather(
+        *(
+            asyncio.shield(task)
+            for task in start_force_update(hass, entry, vin, data_keys)
+        )
+    )
@@ -0,0 +1,75 @@
+"""Retry policies for cloud calls and the statistics recorded for diagnostics."""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+
+
+class RetryPolicy:
+    """Bounded exponential backoff with full jitter and a per-call deadline."""
+
+    def __init__(
+        self,
+        name,
+        max_attempts,
+        base_delay,
+        max_delay,
+        deadline,
+        retry_statuses,
+        retry_errors,
+    ):
+        self.name = name
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_errors = retry_errors
+
+    def compute_delay(self, attempt, retry_after=None):
+        """Return the delay before the next attempt, after the given attempt number."""
+        if retry_after is not None:
+            return max(0.0, retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def parse_retry_after(value):
+    """Return the Retry-After header as seconds, None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+
+class RetryStats:
+    """Attempt counts and retry delays per retry policy."""
+
+    def __init__(self):
+        self._stats = {}
+
+    def record(self, policy_name, attempts, delays, succeeded):
+        """Record a finished call."""
+        stats = self._stats.setdefault(
+            policy_name,
+            {"calls": 0, "retried_calls": 0, "retries": 0, "failed_calls": 0},
+        )
+        stats["calls"] += 1
+        stats["retries"] += attempts - 1
+        if attempts > 1:
+            stats["retried_calls"] += 1
+        if not succeeded:
+            stats["failed_calls"] += 1
+        stats["last_attempts"] = attempts
+        stats["last_delays"] = [round(delay, 2) for delay in delays]
+
+    def as_dict(self):
+        return {name: dict(stats) for name, stats in self._stats.items()}
@@ -1,6 +1,7 @@
 from custom_components.lynkco.sensors import seatbelt, tyre
-from .const import CONFIG_VIN_KEY, COORDINATOR, DOMAIN
+from .const import COORDINATORS, DATA_HTTP_CLIENT, DATA_VEHICLES, DOMAIN
 from .sensors import (
+    backend,
     battery,
     bulb,
     charger_status_data,
@@ -19,24 +20,30 @@ from .sensors import (
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    vin = entry.data.get(CONFIG_VIN_KEY)
-    all_sensors = (
-        battery.create_sensors(coordinator, vin)
-        + charger_status_data.create_sensors(coordinator, vin)
-        + climate.create_sensors(coordinator, vin)
-        + trip.create_sensors(coordinator, vin)
-        + speed.create_sensors(coordinator, vin)
-        + odometer.create_sensors(coordinator, vin)
-        + maintenance_status.create_sensors(coordinator, vin)
-        + fuel.create_sensors(coordinator, vin)
-        + electric_status.create_sensors(coordinator, vin)
-        + position.create_sensors(coordinator, vin)
-        + windows.create_sensors(coordinator, vin)
-        + misc.create_sensors(coordinator, vin)
-        + doors.create_sensors(coordinator, vin)
-        + bulb.create_sensors(coordinator, vin)
-        + tyre.create_sensors(coordinator, vin)
-        + seatbelt.create_sensors(coordinator, vin)
-    )
+    vehicles = hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES]
+    client = hass.data[DOMAIN][entry.entry_id][DATA_HTTP_CLIENT]
+    all_sensors = []
+    for vin, vehicle in vehicles.items():
+        coordinators = vehicle[COORDINATORS]
+        all_sensors += (
+            battery.create_sensors(coordinators, vin)
+            + charger_status_data.create_sensors(coordinators, vin)
+            + climate.create_sensors(coordinators, vin)
+            + trip.create_sensors(coordinators, vin)
+            + speed.create_sensors(coordinators, vin)
+            + odometer.create_sensors(coordinators, vin)
+            + maintenance_status.create_sensors(coordinators, vin)
+            + fuel.create_sensors(coordinators, vin)
+            + electric_status.create_sensors(coordinators, vin)
+            + position.create_sensors(coordinators, vin)
+            + windows.create_sensors(coordinators, vin)
+            + misc.create_sensors(coordinators, vin)
+            + doors.create_sensors(coordinators, vin)
+            + bulb.create_sensors(coordinators, vin)
+            + tyre.create_sensors(coordinators, vin)
+            + seatbelt.create_sensors(coordinators, vin)
+        )
+    # Account wide, shown on the device of the first vehicle
+    if vehicles:
+        all_sensors += backend.create_sensors(client, next(iter(vehicles)))
     async_add_entities(all_sensors)
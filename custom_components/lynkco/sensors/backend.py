@@ -0,0 +1,106 @@
+from homeassistant.core import callback
+from homeassistant.const import EntityCategory
+from homeassistant.helpers.entity import DeviceInfo, Entity
+
+from ..circuit_breaker import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN
+from ..const import DOMAIN
+
+
+def create_sensors(client, vin):
+    return [
+        LynkCoBackendStatusSensor(client, vin),
+        LynkCoApiBudgetSensor(client.rate_limiter, vin),
+    ]
+
+
+class LynkCoBackendStatusSensor(Entity):
+    """Worst circuit breaker state over the backend hosts, per host in the attributes."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:cloud-check-outline"
+    _attr_should_poll = False
+
+    def __init__(self, client, vin):
+        self._client = client
+        self._vin = vin
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"lynk_co_{self._vin}")},
+            manufacturer="Lynk & Co",
+            name=f"Lynk & Co {self._vin}",
+        )
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self._client.async_add_listener(self._handle_change))
+
+    @callback
+    def _handle_change(self):
+        self.async_write_ha_state()
+
+    @property
+    def name(self):
+        return "Lynk & Co Backend Status"
+
+    @property
+    def unique_id(self):
+        return f"{self._vin}_backend_status"
+
+    @property
+    def state(self):
+        states = {
+            circuit_breaker.state
+            for circuit_breaker in self._client.circuit_breakers.values()
+        }
+        for state in (CIRCUIT_OPEN, CIRCUIT_HALF_OPEN):
+            if state in states:
+                return state
+        return CIRCUIT_CLOSED
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            host: circuit_breaker.state
+            for host, circuit_breaker in self._client.circuit_breakers.items()
+        }
+
+
+class LynkCoApiBudgetSensor(Entity):
+    """Requests left today in the daily budget of background requests."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:counter"
+    _attr_should_poll = False
+
+    def __init__(self, rate_limiter, vin):
+        self._rate_limiter = rate_limiter
+        self._vin = vin
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"lynk_co_{self._vin}")},
+            manufacturer="Lynk & Co",
+            name=f"Lynk & Co {self._vin}",
+        )
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self._rate_limiter.async_add_listener(self._handle_change))
+
+    @callback
+    def _handle_change(self):
+        self.async_write_ha_state()
+
+    @property
+    def name(self):
+        return "Lynk & Co API Budget Remaining"
+
+    @property
+    def unique_id(self):
+        return f"{self._vin}_api_budget_remaining"
+
+    @property
+    def state(self):
+        return self._rate_limiter.remaining
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "daily_budget": self._rate_limiter.daily_budget,
+            "used": self._rate_limiter.used,
+        }
@@ -5,10 +5,10 @@ from .lynk_co_sensor import LynkCoSensor
 from .lynk_co_statistics_sensor import LynkCoStatisticsSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co 12V Battery",
             "vehicle_record.battery.chargeLevel",
@@ -17,31 +17,31 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co 12V Battery Charge",
             "vehicle_record.battery.charge",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co 12V Battery Health",
             "vehicle_record.battery.health",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co 12V Battery Power level",
             "vehicle_record.battery.powerLevel",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co 12V Battery Energy level",
             "vehicle_record.battery.energyLevel",
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co 12V Battery Voltage",
             "vehicle_record.battery.voltage",
@@ -24,23 +24,23 @@ CHARGER_STATE = {
 }
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Charger connection status",
             "vehicle_shadow.evs.chargerStatusData.chargerConnectionStatus",
             state_mapping=CHARGER_CONNECTION_STATUS,
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Charger Updated",
             "vehicle_shadow.evs.chargerStatusData.updatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Charge state",
             "vehicle_shadow.evs.chargerStatusData.chargerState",
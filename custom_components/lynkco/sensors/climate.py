@@ -5,10 +5,10 @@ from .lynk_co_sensor import LynkCoSensor
 from .lynk_co_statistics_sensor import LynkCoStatisticsSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Interior Temperature",
             "vehicle_record.climate.interiorTemp.temp",
@@ -17,25 +17,25 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Interior Temperature Quality",
             "vehicle_record.climate.interiorTemp.Quality",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Interior Temperature Unit",
             "vehicle_record.climate.interiorTemp.Unit",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Climate Updated",
             "vehicle_record.climate.vehicleUpdatedAt",
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Exterior temperature",
             "vehicle_record.climate.exteriorTemp.temp",
@@ -44,13 +44,13 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Exterior Temperature Quality",
             "vehicle_record.climate.exteriorTemp.Quality",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Exterior Temperature Unit",
             "vehicle_record.climate.exteriorTemp.Unit",
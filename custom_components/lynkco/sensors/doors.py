@@ -1,112 +1,112 @@
 from .lynk_co_sensor import LynkCoSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door lock status",
             "vehicle_shadow.vls.doorLocksStatus",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Trunk Status",
             "vehicle_shadow.vls.trunkOpenStatus",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Engine Hood Status",
             "vehicle_shadow.vls.engineHoodStatus",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door lock Updated",
             "vehicle_shadow.vls.doorLocksUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Open Status Driver",
             "vehicle_shadow.vls.doorOpenStatusDriver",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Open Status Driver Rear",
             "vehicle_shadow.vls.doorOpenStatusDriverRear",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Open Status Passenger",
             "vehicle_shadow.vls.doorOpenStatusPassenger",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Open Status Passenger Rear",
             "vehicle_shadow.vls.doorOpenStatusPassengerRear",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Lock Status Driver",
             "vehicle_shadow.vls.doorLockStatusDriver",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Lock Status Driver Rear",
             "vehicle_shadow.vls.doorLockStatusDriverRear",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Lock Status Passenger",
             "vehicle_shadow.vls.doorLockStatusPassenger",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Door Lock Status Passenger Rear",
             "vehicle_shadow.vls.doorLockStatusPassengerRear",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Central Locking Updated At",
             "vehicle_shadow.vls.centralLockingUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Sunroof Updated At",
             "vehicle_shadow.vls.sunroofUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Tank Flap Updated At",
             "vehicle_shadow.vls.tankFlapUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Alarm Status Updated At",
             "vehicle_shadow.vls.alarmStatusUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Trunk Open Updated At",
             "vehicle_shadow.vls.trunkOpenUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Engine Hood Updated At",
             "vehicle_shadow.vls.engineHoodUpdatedAt",
@@ -5,16 +5,16 @@ from .lynk_co_sensor import LynkCoSensor
 from .lynk_co_statistics_sensor import LynkCoStatisticsSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Battery Updated",
             "vehicle_record.electricStatus.vehicleUpdatedAt",
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Time until charged",
             "vehicle_record.electricStatus.timeToFullyCharged",
@@ -23,7 +23,7 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Battery",
             "vehicle_record.electricStatus.chargeLevel",
@@ -32,7 +32,7 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Battery distance",
             "vehicle_record.electricStatus.distanceToEmptyOnBatteryOnly",
@@ -5,10 +5,10 @@ from .lynk_co_sensor import LynkCoSensor
 from .lynk_co_statistics_sensor import LynkCoStatisticsSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Fuel Level",
             "vehicle_record.fuel.level",
@@ -17,25 +17,25 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Fuel Updated",
             "vehicle_record.fuel.vehicleUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Fuel Level status",
             "vehicle_record.fuel.levelStatus",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Fuel Type",
             "vehicle_record.fuel.fuelType",
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Fuel distance",
             "vehicle_record.fuel.distanceToEmpty",
@@ -44,7 +44,7 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Fuel avg consumption",
             "vehicle_record.fuel.averageConsumption",
@@ -52,7 +52,7 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Fuel avg consumption latest cycle",
             "vehicle_record.fuel.averageConsumptionLatestDrivingCycle",
@@ -60,7 +60,7 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.MEASUREMENT,
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Tank Flap Status",
             "vehicle_shadow.vls.tankFlapStatus",
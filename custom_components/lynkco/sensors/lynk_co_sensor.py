@@ -3,6 +3,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
 
 from ..const import DOMAIN
+from ..coordinator import get_coordinator_for_path
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -10,19 +11,24 @@ _LOGGER = logging.getLogger(__name__)
 class LynkCoSensor(CoordinatorEntity):
     def __init__(
         self,
-        coordinator,
+        coordinators,
         vin,
         name,
         data_path,
         unit_of_measurement=None,
         state_mapping=None,
     ):
-        super().__init__(coordinator)
+        super().__init__(
+            get_coordinator_for_path(coordinators, data_path),
+            context=frozenset({data_path}),
+        )
         self._vin = vin
         self._name = name
-        self._data_path = data_path.split(".")
+        self._data_path = data_path
         self._unit_of_measurement = unit_of_measurement
         self._state_mapping = state_mapping
+        self._available = False
+        self._available_generation = None
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"lynk_co_{self._vin}")},
@@ -36,26 +42,22 @@ class LynkCoSensor(CoordinatorEntity):
 
     @property
     def state(self):
-        data = self.coordinator.data
-        for key in self._data_path:
-            if data:
-                data = data.get(key)
+        data = self.coordinator.get_value(self._data_path)
         if self._state_mapping:
             return self._state_mapping.get(data, data)
         return data
 
     @property
     def available(self):
-        data = self.coordinator.data
-        for key in self._data_path:
-            if data is not None and key in data:
-                data = data[key]
-            else:
+        # Resolved once per coordinator update, not on every state write
+        if self._available_generation != self.coordinator.data_generation:
+            self._available_generation = self.coordinator.data_generation
+            self._available = self.coordinator.has_path(self._data_path)
+            if not self._available:
                 _LOGGER.error(
                     f"Data path not found: {self._data_path}, coordinator.data: {self.coordinator.data}"
                 )
-                return False  # Data path not found, mark as unavailable
-        return True  # Data path found, mark as available
+        return self._available
 
     @property
     def unit_of_measurement(self):
@@ -9,7 +9,7 @@ class LynkCoStatisticsSensor(LynkCoSensor):
 
     def __init__(
         self,
-        coordinator,
+        coordinators,
         vin,
         name,
         data_path,
@@ -20,7 +20,7 @@ class LynkCoStatisticsSensor(LynkCoSensor):
     ):
         """Initialize the statistics sensor."""
         super().__init__(
-            coordinator, vin, name, data_path, unit_of_measurement, state_mapping
+            coordinators, vin, name, data_path, unit_of_measurement, state_mapping
         )
         self._attr_device_class = device_class
         self._attr_state_class = state_class
@@ -1,34 +1,34 @@
 from .lynk_co_sensor import LynkCoSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Last updated by car",
             "vehicle_record.updatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Vehicle is running updated",
             "vehicle_shadow.bvs.engineStatusUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Vehicle Alarm Status",
             "vehicle_shadow.vls.alarmStatusData",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co SRS Status",
             "vehicle_shadow.vrs.airbagStatus.srsStatus",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Airbag Status Updated At",
             "vehicle_shadow.vrs.airbagStatus.updatedAt",
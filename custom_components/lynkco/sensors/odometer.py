@@ -5,10 +5,10 @@ from .lynk_co_sensor import LynkCoSensor
 from .lynk_co_statistics_sensor import LynkCoStatisticsSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Odometer",
             "vehicle_record.odometer.odometerKm",
@@ -17,7 +17,7 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.TOTAL_INCREASING,
         ),
         LynkCoStatisticsSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Odometer miles",
             "vehicle_record.odometer.odometerMile",
@@ -26,7 +26,7 @@ def create_sensors(coordinator, vin):
             state_class=SensorStateClass.TOTAL_INCREASING,
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Odometer Updated",
             "vehicle_record.odometer.vehicleUpdatedAt",
@@ -1,40 +1,40 @@
 from .lynk_co_sensor import LynkCoSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     sensors = [
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Address",
             "vehicle_address",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Latitude",
             "vehicle_record.position.latitude",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Longitude",
             "vehicle_record.position.longitude",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Altitude",
             "vehicle_record.position.altitude",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Position Updated",
             "vehicle_record.position.vehicleUpdatedAt",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Address raw",
             "vehicle_address_raw",
@@ -1,34 +1,34 @@
 from .lynk_co_sensor import LynkCoSensor
 
 
-def create_sensors(coordinator, vin):
+def create_sensors(coordinators, vin):
     tyre_sensors = [
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Driver Front Tyre Pressure",
             "vehicle_shadow.vrs.vehicleTyresStatus.driverFrontTyre.pressure",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Driver Rear Tyre Pressure",
             "vehicle_shadow.vrs.vehicleTyresStatus.driverRearTyre.pressure",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Passenger Front Tyre Pressure",
             "vehicle_shadow.vrs.vehicleTyresStatus.passengerFrontTyre.pressure",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Passenger Rear Tyre Pressure",
             "vehicle_shadow.vrs.vehicleTyresStatus.passengerRearTyre.pressure",
         ),
         LynkCoSensor(
-            coordinator,
+            coordinators,
             vin,
             "Lynk & Co Tyres Status Updated At",
             "vehicle_shadow.vrs.vehicleTyresStatus.updatedAt",
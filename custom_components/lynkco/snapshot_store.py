@@ -0,0 +1,45 @@
+"""Persist the last fetched vehicle data so entities can warm start from it."""
+
+import logging
+
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DATA_ADDRESS_KEY,
+    DATA_RECORD_KEY,
+    DATA_SHADOW_KEY,
+    DOMAIN,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_SAVE_DELAY_SECONDS = 60
+
+
+class SnapshotStore:
+    """Last known coordinator data per vehicle and data domain, stored per config entry."""
+
+    def __init__(self, hass, entry_id):
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_snapshot_{entry_id}")
+        self._snapshot = {}
+
+    async def async_load(self):
+        """Load the stored snapshot, keyed by VIN and data domain."""
+        stored = await self._store.async_load() or {}
+        # Snapshots of single vehicle entries were keyed by data domain only
+        legacy_keys = (DATA_RECORD_KEY, DATA_SHADOW_KEY, DATA_ADDRESS_KEY)
+        self._snapshot = {
+            vin: data for vin, data in stored.items() if vin not in legacy_keys
+        }
+        _LOGGER.debug(f"Loaded snapshot for {list(self._snapshot)}")
+        return self._snapshot
+
+    def async_save(self, vin, data_key, data):
+        """Schedule a write of the latest data of one data domain of a vehicle."""
+        self._snapshot.setdefault(vin, {})[data_key] = data
+        self._store.async_delay_save(lambda: self._snapshot, SNAPSHOT_SAVE_DELAY_SECONDS)
+
+    async def async_remove(self):
+        """Remove the stored snapshot."""
+        await self._store.async_remove()
@@ -2,28 +2,37 @@ import base64
 import json
 import logging
 import os
+import random
 import time
 
-import aiohttp
 from homeassistant.auth.models import uuid
 from homeassistant.config_entries import asyncio
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
 from .const import (
     DOMAIN,
     STORAGE_CCC_TOKEN_KEY,
     STORAGE_REFRESH_TOKEN_KEY,
+    STORAGE_TOKEN_CACHE_KEY,
     STORAGE_TOKEN_KEY,
     STORAGE_USER_ID_KEY,
+    STORAGE_USER_IDS_KEY,
     STORAGE_VERSION,
 )
+from .rate_limiter import PRIORITY_AUTH
 
 _LOGGER = logging.getLogger(__name__)
-ccc_token_lock = asyncio.Lock()
 
 DIR_PATH = os.path.dirname(os.path.realpath(__file__))
 
+# Refresh this long before the CCC token expires so requests never see it expire
+TOKEN_REFRESH_MARGIN_SECONDS = 600
+TOKEN_REFRESH_RETRY_SECONDS = 60
+# Spreads the refreshes of entries started together, well within the margin
+TOKEN_REFRESH_JITTER_SECONDS = 120
+
 
 def decode_jwt_token(token):
     """Decode JWT token without signature verification."""
@@ -34,39 +43,190 @@ def decode_jwt_token(token):
     return json.loads(decoded)
 
 
-async def is_token_expired(token):
-    """Check if the JWT token is expired."""
-    decoded_token = decode_jwt_token(token)
-    current_time = time.time()
-    return decoded_token["exp"] < current_time
+def get_account_id(claims):
+    """Return the key of the account of decoded token claims, None if they name none."""
+    account_id = claims.get("snowflakeId") or claims.get("sub")
+    return str(account_id) if account_id else None
+
+
+class CccTokenCache:
+    """In-memory copy of the CCC token of one account and its decoded expiry."""
+
+    def __init__(self):
+        self.token = None
+        self.expires_at = 0.0
+        self.loaded = False
+        self.refresh_task = None
+        self.lock = asyncio.Lock()
+
+    def set_token(self, token):
+        """Store a new token and decode its expiry once."""
+        self.token = token
+        self.expires_at = decode_jwt_token(token)["exp"] if token else 0.0
+        self.loaded = True
+
+    def is_valid(self):
+        """Return True if a token is cached and has not expired."""
+        return self.token is not None and self.expires_at >= time.time()
+
+    def needs_refresh(self):
+        """Return True if the token is missing or within the refresh margin."""
+        return (
+            self.token is None
+            or self.expires_at - TOKEN_REFRESH_MARGIN_SECONDS < time.time()
+        )
+
+    def is_refreshing(self):
+        """Return True while a refresh is in flight."""
+        return self.refresh_task is not None and not self.refresh_task.done()
+
+
+async def get_ccc_token(hass, client):
+    """Return a valid CCC token of the client's account, only touching storage on first use or refresh."""
+    token_cache = await async_load_token_cache(hass, client.account_id)
+    if token_cache.is_valid():
+        if token_cache.needs_refresh() and not token_cache.is_refreshing():
+            # Still usable, renew in the background instead of blocking the caller
+            hass.async_create_task(async_background_refresh(hass, client))
+        return token_cache.token
+    return await async_refresh_ccc_token(hass, client)
+
+
+async def async_load_token_cache(hass, account_id):
+    """Return the token cache of an account, loading the stored token on first use."""
+    token_cache = get_token_cache(hass, account_id)
+    if not token_cache.loaded:
+        async with token_cache.lock:
+            if not token_cache.loaded:
+                tokens = await get_token_storage(hass, account_id).async_load() or {}
+                token_cache.set_token(tokens.get(STORAGE_CCC_TOKEN_KEY))
+    return token_cache
+
+
+async def async_refresh_ccc_token(hass, client):
+    """Refresh the tokens of the client's account, joining a refresh that is already in flight."""
+    token_cache = get_token_cache(hass, client.account_id)
+    if not token_cache.is_refreshing():
+        token_cache.refresh_task = hass.async_create_task(
+            refresh_tokens(hass, client)
+        )
+    return await asyncio.shield(token_cache.refresh_task)
+
+
+async def async_background_refresh(hass, client):
+    """Refresh the tokens without propagating errors to the caller."""
+    try:
+        await async_refresh_ccc_token(hass, client)
+    except ConfigEntryAuthFailed:
+        _LOGGER.warning("Background token refresh failed, re-authentication needed")
+    except Exception as error:
+        _LOGGER.warning("Background token refresh failed: %s", str(error))
+
+
+class TokenRefreshScheduler:
+    """Refresh the CCC token ahead of its expiry."""
 
+    def __init__(self, hass, client):
+        self._hass = hass
+        self._client = client
+        self._unsub_timer = None
 
-async def get_ccc_token(hass):
-    """Retrieve the CCC token from file if is valid."""
-    async with ccc_token_lock:
-        token_storage = get_token_storage(hass)
-        tokens = await token_storage.async_load()
-        ccc_token = tokens.get(STORAGE_CCC_TOKEN_KEY)
-        if ccc_token is None or await is_token_expired(ccc_token):
-            ccc_token = await refresh_tokens(hass)
-    return ccc_token
+    async def async_start(self):
+        """Load the current token and schedule the first refresh."""
+        await async_load_token_cache(self._hass, self._client.account_id)
+        self._schedule()
 
+    def async_stop(self):
+        """Cancel the pending refresh."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
 
-def get_token_storage(hass):
+    def _schedule(self, delay=None):
+        if delay is None:
+            token_cache = get_token_cache(self._hass, self._client.account_id)
+            delay = max(
+                TOKEN_REFRESH_RETRY_SECONDS,
+                token_cache.expires_at - TOKEN_REFRESH_MARGIN_SECONDS - time.time(),
+            ) + random.uniform(0, TOKEN_REFRESH_JITTER_SECONDS)
+        _LOGGER.debug(f"Next token refresh in {int(delay)} s")
+        self._unsub_timer = async_call_later(self._hass, delay, self._handle_timer)
+
+    async def _handle_timer(self, _now):
+        self._unsub_timer = None
+        if get_token_cache(self._hass, self._client.account_id).needs_refresh():
+            try:
+                await async_refresh_ccc_token(self._hass, self._client)
+            except ConfigEntryAuthFailed:
+                # Polling raises the same error and starts the re-auth flow
+                _LOGGER.warning("Scheduled token refresh failed, re-authentication needed")
+                return
+            except Exception as error:
+                _LOGGER.warning("Scheduled token refresh failed: %s", str(error))
+                self._schedule(TOKEN_REFRESH_RETRY_SECONDS)
+                return
+        self._schedule()
+
+
+def get_token_cache(hass, account_id):
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {}
+
+    token_caches = hass.data[DOMAIN].setdefault(STORAGE_TOKEN_CACHE_KEY, {})
+    if account_id not in token_caches:
+        token_caches[account_id] = CccTokenCache()
+
+    return token_caches[account_id]
+
+
+def get_token_storage(hass, account_id):
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
-    if STORAGE_TOKEN_KEY not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][STORAGE_TOKEN_KEY] = Store(
-            hass, STORAGE_VERSION, f"{DOMAIN}_tokens"
+    token_storages = hass.data[DOMAIN].setdefault(STORAGE_TOKEN_KEY, {})
+    if account_id not in token_storages:
+        token_storages[account_id] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}_tokens_{account_id}"
         )
 
-    return hass.data[DOMAIN][STORAGE_TOKEN_KEY]
+    return token_storages[account_id]
+
 
+async def async_migrate_legacy_tokens(hass, entry, remove_legacy):
+    """Copy the tokens shared by all entries to the store of the entry's account.
 
-async def refresh_tokens(hass):
-    token_storage = get_token_storage(hass)
-    tokens = await token_storage.async_load()
+    Returns the account the tokens belong to, resolved from the claims of
+    the stored CCC token like the config flow does, or the entry itself when
+    they cannot be decoded. Tokens already stored for the account are kept.
+    """
+    legacy_storage = Store(hass, STORAGE_VERSION, f"{DOMAIN}_tokens")
+    tokens = await legacy_storage.async_load() or {}
+    account_id = None
+    if ccc_token := tokens.get(STORAGE_CCC_TOKEN_KEY):
+        try:
+            account_id = get_account_id(decode_jwt_token(ccc_token))
+        except (IndexError, ValueError):
+            _LOGGER.warning(f"Could not decode the stored token of entry {entry.entry_id}")
+    account_id = account_id or entry.entry_id
+    token_storage = get_token_storage(hass, account_id)
+    if tokens and not await token_storage.async_load():
+        await token_storage.async_save(tokens)
+        _LOGGER.info(f"Moved stored tokens of entry {entry.entry_id} to its account")
+    if remove_legacy:
+        await legacy_storage.async_remove()
+    return account_id
+
+
+async def async_remove_tokens(hass, account_id):
+    """Remove the stored and cached tokens of an account."""
+    await get_token_storage(hass, account_id).async_remove()
+    hass.data[DOMAIN].get(STORAGE_TOKEN_KEY, {}).pop(account_id, None)
+    hass.data[DOMAIN].get(STORAGE_TOKEN_CACHE_KEY, {}).pop(account_id, None)
+
+
+async def refresh_tokens(hass, client):
+    token_storage = get_token_storage(hass, client.account_id)
+    tokens = await token_storage.async_load() or {}
     refresh_token = tokens.get(STORAGE_REFRESH_TOKEN_KEY)
     if refresh_token is None:
         _LOGGER.error("Refresh token is None, re-authenticate")
@@ -82,48 +242,47 @@ async def refresh_tokens(hass):
         "refresh_token": refresh_token,
         "grant_type": "refresh_token",
     }
-    async with aiohttp.ClientSession(
-        connector=aiohttp.TCPConnector(ssl=False)
-    ) as session:
-        async with session.post(
-            "https://login.lynkco.com/dc6c7c0c-5ba7-414a-a7d1-d62ca1f73d13/b2c_1a_signin_mfa/oauth2/v2.0/token",
-            headers=headers,
-            data=data,
-        ) as response:
-            if response.status == 200:
-                tokens = await response.json()
-                stored_tokens = await token_storage.async_load()
-                new_refresh_token = tokens.get("refresh_token")
-                if new_refresh_token:
-                    _LOGGER.debug("Refreshed refresh token")
-                    stored_tokens[STORAGE_REFRESH_TOKEN_KEY] = new_refresh_token
+    async with client.post(
+        "https://login.lynkco.com/dc6c7c0c-5ba7-414a-a7d1-d62ca1f73d13/b2c_1a_signin_mfa/oauth2/v2.0/token",
+        headers=headers,
+        data=data,
+        priority=PRIORITY_AUTH,
+    ) as response:
+        if response.status == 200:
+            tokens = await response.json()
+            stored_tokens = await token_storage.async_load() or {}
+            new_refresh_token = tokens.get("refresh_token")
+            if new_refresh_token:
+                _LOGGER.debug("Refreshed refresh token")
+                stored_tokens[STORAGE_REFRESH_TOKEN_KEY] = new_refresh_token
+            else:
+                _LOGGER.error("New refresh token is None")
+                raise ConfigEntryAuthFailed(
+                    "Token has expired, please re-authenticate."
+                )
+            access_token = tokens["access_token"]
+            if access_token:
+                ccc_token = await send_device_login(access_token, client)
+                if ccc_token:
+                    _LOGGER.debug("Refreshed ccc token")
+                    stored_tokens[STORAGE_CCC_TOKEN_KEY] = ccc_token
+                    get_token_cache(hass, client.account_id).set_token(ccc_token)
                 else:
-                    _LOGGER.error("New refresh token is None")
+                    _LOGGER.error("New ccc token is None, please re-authenticate")
                     raise ConfigEntryAuthFailed(
                         "Token has expired, please re-authenticate."
                     )
-                access_token = tokens["access_token"]
-                if access_token:
-                    ccc_token = await send_device_login(access_token)
-                    if ccc_token:
-                        _LOGGER.debug("Refreshed ccc token")
-                        stored_tokens[STORAGE_CCC_TOKEN_KEY] = ccc_token
-                    else:
-                        _LOGGER.error("New ccc token is None, please re-authenticate")
-                        raise ConfigEntryAuthFailed(
-                            "Token has expired, please re-authenticate."
-                        )
-                else:
-                    _LOGGER.error("Access token is None")
-                    ccc_token = None
-                await token_storage.async_save(stored_tokens)
-                return ccc_token
             else:
-                _LOGGER.error("Failed to get new refresh token")
+                _LOGGER.error("Access token is None")
+                ccc_token = None
+            await token_storage.async_save(stored_tokens)
+            return ccc_token
+        else:
+            _LOGGER.error("Failed to get new refresh token")
     return None
 
 
-async def send_device_login(access_token: str):
+async def send_device_login(access_token: str, client):
     headers = {
         "user-agent": "LynkCo/3016 CFNetwork/1492.0.1 Darwin/23.3.0",
         "accept": "application/json",
@@ -134,14 +293,12 @@ async def send_device_login(access_token: str):
         "api-version": "1",
     }
     data = {"deviceUuid": str(uuid.uuid4()), "isLogin": True}
-    async with (
-        aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session,
-        session.post(
-            "https://iam-service-prod.westeurope.cloudapp.azure.com/validate-session",
-            headers=headers,
-            json=data,
-        ) as response,
-    ):
+    async with client.post(
+        "https://iam-service-prod.westeurope.cloudapp.azure.com/validate-session",
+        headers=headers,
+        json=data,
+        priority=PRIORITY_AUTH,
+    ) as response:
         if response.status == 200:
             data = await response.json()
             return data["cccToken"]
@@ -151,29 +308,35 @@ async def send_device_login(access_token: str):
     return None
 
 
-async def get_user_id(hass, ccc_token, vin):
-    token_storage = get_token_storage(hass)
-    tokens = await token_storage.async_load()
-    user_id = tokens.get(STORAGE_USER_ID_KEY)
-    if user_id is not None:
+async def get_user_id(
+    hass, ccc_token, vin, client, priority=PRIORITY_AUTH, force_refresh=False
+):
+    """Return the user ID of the first driver of a vehicle, stored per VIN.
+
+    force_refresh looks it up again instead of returning the stored one.
+    """
+    token_storage = get_token_storage(hass, client.account_id)
+    tokens = await token_storage.async_load() or {}
+    user_id = tokens.get(STORAGE_USER_IDS_KEY, {}).get(vin)
+    if user_id is not None and not force_refresh:
         return user_id
     headers = {
         "accept": "application/json",
         "content-type": "application/json",
         "Authorization": f"Bearer {ccc_token}",
     }
-    async with (
-        aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session,
-        session.get(
-            f"https://delegated-driver-tls.aion.connectedcar.cloud/delegated-driver/api/delegateddriver/v1/vehicle/{vin}/drivers",
-            headers=headers,
-        ) as response,
-    ):
+    async with client.get(
+        f"https://delegated-driver-tls.aion.connectedcar.cloud/delegated-driver/api/delegateddriver/v1/vehicle/{vin}/drivers",
+        headers=headers,
+        priority=priority,
+    ) as response:
         if response.status == 200:
             response_json = await response.json()
             if response_json["drivers"]:
                 user_id = response_json["drivers"][0]["userId"]
-                tokens[STORAGE_USER_ID_KEY] = user_id
+                # The user ID once stored for the whole account came from one vehicle only
+                tokens.pop(STORAGE_USER_ID_KEY, None)
+                tokens.setdefault(STORAGE_USER_IDS_KEY, {})[vin] = user_id
                 await token_storage.async_save(tokens)
                 return user_id
             else:
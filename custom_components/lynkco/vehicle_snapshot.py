@@ -0,0 +1,129 @@
+"""Immutable, versioned snapshots of the data of one vehicle."""
+
+from collections import deque
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Previous snapshots kept per vehicle, unchanged subtrees are shared with them
+SNAPSHOT_HISTORY_SIZE = 5
+
+_MISSING = object()
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+
+class FrozenDict(dict):
+    """Dict that can no longer be changed once built."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """List that can no longer be changed once built."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value, previous=None):
+    """Return an immutable copy of a JSON value, reusing the equal subtrees of previous.
+
+    A dict or list is reused as a whole when all its items were reused, so
+    an unchanged document costs no new memory and changed ones only copy
+    the path down to the changes.
+    """
+    if isinstance(value, dict):
+        if not isinstance(previous, FrozenDict):
+            previous = {}
+        frozen = {
+            key: freeze(item, previous.get(key, _MISSING))
+            for key, item in value.items()
+        }
+        if len(frozen) == len(previous) and all(
+            key in previous and item is previous[key] for key, item in frozen.items()
+        ):
+            return previous
+        return FrozenDict(frozen)
+    if isinstance(value, list):
+        if not isinstance(previous, FrozenList):
+            previous = ()
+        frozen = [
+            freeze(item, previous[index] if index < len(previous) else _MISSING)
+            for index, item in enumerate(value)
+        ]
+        if len(frozen) == len(previous) and all(
+            item is previous_item for item, previous_item in zip(frozen, previous)
+        ):
+            return previous
+        return FrozenList(frozen)
+    if previous is not _MISSING and type(previous) is type(value) and previous == value:
+        return previous
+    return value
+
+
+class VehicleSnapshot:
+    """Data and fetch times of every data domain of a vehicle at one version."""
+
+    __slots__ = ("version", "data", "fetched_at")
+
+    def __init__(self, version, data, fetched_at):
+        self.version = version
+        self.data = data
+        self.fetched_at = fetched_at
+
+    def get(self, data_key, default=None):
+        return self.data.get(data_key, default)
+
+    def __contains__(self, data_key):
+        return data_key in self.data
+
+
+class VehicleSnapshotHistory:
+    """Current snapshot of a vehicle and the versions before it.
+
+    Every change builds a new snapshot that shares the unchanged data
+    domains and subtrees with the previous one, and swaps it in with a
+    single assignment, so readers always see a consistent version.
+    """
+
+    def __init__(self, vin):
+        self._vin = vin
+        self.current = VehicleSnapshot(0, FrozenDict(), FrozenDict())
+        self.previous = deque(maxlen=SNAPSHOT_HISTORY_SIZE)
+
+    def commit(self, data_key, data, fetched_at=None):
+        """Store new data of one data domain, returning its frozen copy."""
+        current = self.current
+        frozen = freeze(data, current.data.get(data_key, _MISSING))
+        if frozen is current.data.get(data_key) and fetched_at is None:
+            return frozen
+        fetched = dict(current.fetched_at)
+        if fetched_at is not None:
+            fetched[data_key] = fetched_at
+        self.previous.append(current)
+        self.current = VehicleSnapshot(
+            current.version + 1,
+            FrozenDict({**current.data, data_key: frozen}),
+            FrozenDict(fetched),
+        )
+        _LOGGER.debug(f"Snapshot {self.current.version} of {self._vin} with new {data_key}")
+        return frozen
+
+    def as_dict(self):
+        return {
+            "version": self.current.version,
+            "fetched_at": dict(self.current.fetched_at),
+            "previous_versions": [snapshot.version for snapshot in self.previous],
+        }
@@ -0,0 +1,48 @@
+"""Shared fixtures of the tests, which run without a Home Assistant instance."""
+
+import asyncio
+
+import pytest
+
+
+class FakeHass:
+    """Just enough of Home Assistant to run the integration's helpers in a test loop."""
+
+    def __init__(self):
+        self.data = {}
+
+    @property
+    def loop(self):
+        return asyncio.get_running_loop()
+
+    def async_create_task(self, coro):
+        return self.loop.create_task(coro)
+
+
+class FakeStore:
+    """In-memory stand-in for a Home Assistant Store."""
+
+    def __init__(self):
+        self.stored = None
+        self.loads = 0
+
+    async def async_load(self):
+        self.loads += 1
+        await asyncio.sleep(0)
+        return self.stored
+
+    async def async_save(self, data):
+        self.stored = data
+
+    def async_delay_save(self, data_func, delay):
+        pass
+
+
+@pytest.fixture
+def fake_hass():
+    return FakeHass()
+
+
+@pytest.fixture
+def fake_store():
+    return FakeStore()
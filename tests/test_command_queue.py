@@ -0,0 +1,83 @@
+"""Tests for the per-vehicle command queue."""
+
+import asyncio
+
+from custom_components.lynkco.command_queue import CommandQueue
+from custom_components.lynkco.const import (
+    COMMAND_RESULT_SENT,
+    COMMAND_RESULT_SUPERSEDED,
+    EXPECTED_STATE_LOCKED,
+    EXPECTED_STATE_UNLOCKED,
+    SERVICE_LOCK_DOORS_KEY,
+    SERVICE_UNLOCK_DOORS_KEY,
+)
+
+
+def test_lock_after_queued_unlock_is_sent(fake_hass):
+    """Lock in flight, unlock queued, lock again: the car must end up locked."""
+
+    async def run():
+        queue = CommandQueue(fake_hass, "VIN")
+        sent = []
+        release = asyncio.Event()
+
+        def command(name):
+            async def send():
+                sent.append(name)
+                await release.wait()
+                return True
+
+            return send
+
+        first_lock = asyncio.ensure_future(
+            queue.async_submit(
+                (SERVICE_LOCK_DOORS_KEY,), command("lock"), EXPECTED_STATE_LOCKED
+            )
+        )
+        await asyncio.sleep(0)
+        unlock = asyncio.ensure_future(
+            queue.async_submit(
+                (SERVICE_UNLOCK_DOORS_KEY,), command("unlock"), EXPECTED_STATE_UNLOCKED
+            )
+        )
+        await asyncio.sleep(0)
+        second_lock = asyncio.ensure_future(
+            queue.async_submit(
+                (SERVICE_LOCK_DOORS_KEY,), command("lock"), EXPECTED_STATE_LOCKED
+            )
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first_lock, unlock, second_lock)
+        return sent, results
+
+    sent, results = asyncio.run(run())
+    assert sent == ["lock", "lock"]
+    assert results == [
+        COMMAND_RESULT_SENT,
+        COMMAND_RESULT_SUPERSEDED,
+        COMMAND_RESULT_SENT,
+    ]
+
+
+def test_repeated_lock_is_deduplicated(fake_hass):
+    """Repeating the command in flight shares its result instead of sending again."""
+
+    async def run():
+        queue = CommandQueue(fake_hass, "VIN")
+        sent = []
+
+        async def lock():
+            sent.append("lock")
+            await asyncio.sleep(0)
+            return True
+
+        results = await asyncio.gather(
+            queue.async_submit((SERVICE_LOCK_DOORS_KEY,), lock, EXPECTED_STATE_LOCKED),
+            queue.async_submit((SERVICE_LOCK_DOORS_KEY,), lock, EXPECTED_STATE_LOCKED),
+        )
+        return sent, results
+
+    sent, results = asyncio.run(run())
+    assert sent == ["lock"]
+    assert results == [COMMAND_RESULT_SENT, COMMAND_RESULT_SENT]
@@ -0,0 +1,18 @@
+"""Tests for the dotted path index of the coordinator data."""
+
+from custom_components.lynkco.coordinator import build_path_index, diff_path_indexes
+
+
+def test_type_change_is_detected():
+    previous_index = build_path_index({"vls": {"locked": 1, "open": 0}})
+    path_index = build_path_index({"vls": {"locked": True, "open": False}})
+    assert diff_path_indexes(previous_index, path_index) == {
+        "vls",
+        "vls.locked",
+        "vls.open",
+    }
+
+
+def test_unchanged_data_has_no_changed_paths():
+    data = {"vls": {"locked": True}, "speed": 0}
+    assert diff_path_indexes(build_path_index(data), build_path_index(data)) == set()
@@ -0,0 +1,77 @@
+"""Tests for the reverse geocoding cache."""
+
+import asyncio
+import time
+
+from custom_components.lynkco.geocoding_cache import (
+    GEOCODE_CACHE_TTL_SECONDS,
+    GeocodeCache,
+)
+
+ADDRESS_RESPONSE = {
+    "addressComponents": [{"longName": "Main Street", "types": ["route"]}]
+}
+
+
+def make_cache(store, stored=None):
+    cache = GeocodeCache(None)
+    store.stored = stored
+    cache._store = store
+    return cache
+
+
+def test_expired_last_position_is_fetched_again(fake_store):
+    expired_at = time.time() - GEOCODE_CACHE_TTL_SECONDS - 1
+    cache = make_cache(
+        fake_store,
+        {
+            "last_positions": {
+                "VIN": {
+                    "latitude": 57.7,
+                    "longitude": 11.9,
+                    "address": "Old Street",
+                    "address_raw": "Old Street",
+                    "created_at": expired_at,
+                }
+            }
+        }
+    )
+    fetches = []
+
+    async def fetch():
+        fetches.append(True)
+        return ADDRESS_RESPONSE
+
+    address = asyncio.run(cache.async_get_address("VIN", 57.7, 11.9, 50, fetch))
+    assert address == ("Main Street", "Main Street")
+    assert fetches == [True]
+
+
+def test_concurrent_lookups_wait_for_the_store(fake_store):
+    cache = make_cache(
+        fake_store,
+        {
+            "entries": {
+                "57.7,11.9": {
+                    "address": "Stored Street",
+                    "address_raw": "Stored Street",
+                    "created_at": time.time(),
+                }
+            }
+        }
+    )
+    fetches = []
+
+    async def fetch():
+        fetches.append(True)
+        return ADDRESS_RESPONSE
+
+    async def run():
+        return await asyncio.gather(
+            cache.async_get_address("VIN", 57.7, 11.9, 50, fetch),
+            cache.async_get_address("OTHER", 57.7, 11.9, 50, fetch),
+        )
+
+    assert asyncio.run(run()) == [("Stored Street", "Stored Street")] * 2
+    assert fetches == []
+    assert cache._store.loads == 1
@@ -0,0 +1,15 @@
+"""Tests for the pooled HTTP client."""
+
+import asyncio
+
+import pytest
+
+from custom_components.lynkco.http_client import ClientClosedError, LynkCoHttpClient
+
+
+def test_closed_client_does_not_open_a_new_session():
+    client = LynkCoHttpClient()
+    asyncio.run(client.async_close())
+    with pytest.raises(ClientClosedError):
+        client.session
+    assert client._session is None
@@ -0,0 +1,115 @@
+"""Tests for running the command services."""
+
+import asyncio
+
+import custom_components.lynkco as lynkco
+from custom_components.lynkco.const import (
+    COMMAND_RESULT_FAILED,
+    COMMAND_RESULT_SENT,
+    COMMAND_RESULT_SUPERSEDED,
+    DATA_EXPECTED_STATE,
+    DATA_HTTP_CLIENT,
+    DATA_VEHICLES,
+    DOMAIN,
+    EXPECTED_STATE_LOCKED,
+    EXPECTED_STATE_UNLOCKED,
+    SERVICE_LOCK_DOORS_KEY,
+    SERVICE_UNLOCK_DOORS_KEY,
+)
+from custom_components.lynkco.expected_state_monitor import ExpectedStateMonitor
+from custom_components.lynkco.rate_limiter import BudgetExhaustedError
+
+VIN = "VIN"
+
+
+class FakeEntry:
+    entry_id = "entry"
+    options = {}
+
+
+class FakeCall:
+    data = {"force": True}
+
+    def __init__(self, service=SERVICE_LOCK_DOORS_KEY):
+        self.service = service
+
+
+def add_vehicle(hass, monkeypatch):
+    """Add a vehicle and target every command at it."""
+    hass.data[DOMAIN] = {
+        FakeEntry.entry_id: {
+            DATA_VEHICLES: {VIN: {DATA_EXPECTED_STATE: ExpectedStateMonitor(VIN)}},
+            DATA_HTTP_CLIENT: None,
+        }
+    }
+    monkeypatch.setattr(lynkco, "get_command_target", lambda hass, call: (FakeEntry(), VIN))
+    return hass.data[DOMAIN][FakeEntry.entry_id][DATA_VEHICLES][VIN][DATA_EXPECTED_STATE]
+
+
+def test_failed_command_is_not_watched(fake_hass, monkeypatch):
+    monitor = add_vehicle(fake_hass, monkeypatch)
+
+    async def lock(hass, vin, client):
+        return False
+
+    response = asyncio.run(
+        lynkco.run_command(fake_hass, FakeCall(), lock, expected_state=EXPECTED_STATE_LOCKED)
+    )
+    assert response["result"] == COMMAND_RESULT_FAILED
+    assert monitor.expected_states == {}
+
+
+def test_request_error_returns_failed(fake_hass, monkeypatch):
+    monitor = add_vehicle(fake_hass, monkeypatch)
+
+    async def lock(hass, vin, client):
+        raise BudgetExhaustedError("Daily budget of 0 requests used up")
+
+    response = asyncio.run(
+        lynkco.run_command(fake_hass, FakeCall(), lock, expected_state=EXPECTED_STATE_LOCKED)
+    )
+    assert response["result"] == COMMAND_RESULT_FAILED
+    assert monitor.expected_states == {}
+
+
+def test_superseded_command_is_not_watched(fake_hass, monkeypatch):
+    monitor = add_vehicle(fake_hass, monkeypatch)
+    release = asyncio.Event()
+
+    async def lock(hass, vin, client):
+        await release.wait()
+        return True
+
+    async def unlock(hass, vin, client):
+        return True
+
+    async def run():
+        first_lock = asyncio.ensure_future(
+            lynkco.run_command(fake_hass, FakeCall(), lock, expected_state=EXPECTED_STATE_LOCKED)
+        )
+        await asyncio.sleep(0)
+        unlocked = asyncio.ensure_future(
+            lynkco.run_command(
+                fake_hass,
+                FakeCall(SERVICE_UNLOCK_DOORS_KEY),
+                unlock,
+                expected_state=EXPECTED_STATE_UNLOCKED,
+            )
+        )
+        await asyncio.sleep(0)
+        second_lock = asyncio.ensure_future(
+            lynkco.run_command(fake_hass, FakeCall(), lock, expected_state=EXPECTED_STATE_LOCKED)
+        )
+        await asyncio.sleep(0)
+        release.set()
+        return [
+            response["result"]
+            for response in await asyncio.gather(first_lock, unlocked, second_lock)
+        ]
+
+    assert asyncio.run(run()) == [
+        COMMAND_RESULT_SENT,
+        COMMAND_RESULT_SUPERSEDED,
+        COMMAND_RESULT_SENT,
+    ]
+    assert list(monitor.expected_states) == [EXPECTED_STATE_LOCKED]
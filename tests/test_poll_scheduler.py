@@ -0,0 +1,37 @@
+"""Tests for the phase and delay of the adaptive polls."""
+
+from custom_components.lynkco.poll_scheduler import (
+    POLL_MAX_JITTER_SECONDS,
+    AdaptivePollScheduler,
+    poll_phase,
+)
+
+INTERVAL_SECONDS = 30 * 60
+
+
+def test_single_vehicle_entries_get_different_phases():
+    phases = {poll_phase(f"entry_{index}", 0, 1) for index in range(20)}
+    assert len(phases) == 20
+
+
+def test_vehicles_of_an_entry_are_spread_evenly():
+    phases = sorted(poll_phase("entry", index, 4) for index in range(4))
+    gaps = [round((later - earlier) % 1, 6) for earlier, later in zip(phases, phases[1:])]
+    assert gaps == [0.25, 0.25, 0.25]
+
+
+def test_delay_stays_within_interval_plus_jitter():
+    scheduler = AdaptivePollScheduler(5, 30, 2, poll_phase("entry", 0, 1))
+    for _ in range(200):
+        delay = scheduler._phased_delay(INTERVAL_SECONDS).total_seconds()
+        assert 5 * 60 <= delay <= INTERVAL_SECONDS + POLL_MAX_JITTER_SECONDS
+
+
+def test_entries_started_apart_do_not_poll_together():
+    first = AdaptivePollScheduler(5, 30, 2, poll_phase("first_entry", 0, 1))
+    second = AdaptivePollScheduler(5, 30, 2, poll_phase("second_entry", 0, 1))
+    gap = abs(
+        first._phased_delay(INTERVAL_SECONDS).total_seconds()
+        - second._phased_delay(INTERVAL_SECONDS).total_seconds()
+    )
+    assert min(gap, INTERVAL_SECONDS - gap) > POLL_MAX_JITTER_SECONDS
@@ -0,0 +1,149 @@
+"""Tests for skipping commands whose state the vehicle already reports."""
+
+import asyncio
+from datetime import datetime
+import time
+
+from custom_components.lynkco import remote_control_manager
+from custom_components.lynkco.command_queue import get_command_queue
+from custom_components.lynkco.const import (
+    COORDINATORS,
+    DATA_EXPECTED_STATE,
+    DATA_FORCED_REFRESHES,
+    DATA_IS_FORCE_UPDATE,
+    DATA_RECORD_KEY,
+    DATA_SHADOW_KEY,
+    DATA_VEHICLES,
+    DOMAIN,
+    DOOR_LOCKS_STATUS_PATH,
+    EXPECTED_STATE_LOCKED,
+    EXPECTED_STATE_UNLOCKED,
+    SERVICE_LOCK_DOORS_KEY,
+)
+from custom_components.lynkco.expected_state_monitor import ExpectedStateMonitor
+from custom_components.lynkco.remote_control_manager import (
+    force_update_data,
+    is_command_redundant,
+)
+
+VIN = "VIN"
+
+
+class FakeCoordinator:
+    def __init__(self, values):
+        self.fetched_at = time.time()
+        self._values = values
+
+    def get_value(self, data_path, default=None):
+        return self._values.get(data_path, default)
+
+
+class FakeEntry:
+    entry_id = "entry"
+    options = {}
+
+
+def add_vehicle(hass, door_locks_status="DOOR_LOCKS_STATUS_UNLOCKED"):
+    """Add a vehicle whose fresh data shows the given lock status."""
+    hass.data[DOMAIN] = {
+        FakeEntry.entry_id: {
+            DATA_VEHICLES: {
+                VIN: {
+                    COORDINATORS: {
+                        DATA_RECORD_KEY: FakeCoordinator({}),
+                        DATA_SHADOW_KEY: FakeCoordinator(
+                            {DOOR_LOCKS_STATUS_PATH: door_locks_status}
+                        ),
+                    },
+                    DATA_EXPECTED_STATE: ExpectedStateMonitor(VIN),
+                }
+            }
+        }
+    }
+    return hass
+
+
+def test_unlock_skipped_when_data_shows_unlocked(fake_hass):
+    async def run():
+        hass = add_vehicle(fake_hass)
+        return is_command_redundant(hass, FakeEntry(), VIN, EXPECTED_STATE_UNLOCKED)
+
+    assert asyncio.run(run())
+
+
+def test_unlock_sent_while_lock_is_in_flight(fake_hass):
+    """Fresh data saying unlocked must not skip an unlock after a lock was sent."""
+
+    async def run():
+        hass = add_vehicle(fake_hass)
+        release = asyncio.Event()
+
+        async def lock():
+            await release.wait()
+            return True
+
+        pending_lock = asyncio.ensure_future(
+            get_command_queue(hass, VIN).async_submit(
+                (SERVICE_LOCK_DOORS_KEY,), lock, EXPECTED_STATE_LOCKED
+            )
+        )
+        await asyncio.sleep(0)
+        redundant = is_command_redundant(hass, FakeEntry(), VIN, EXPECTED_STATE_UNLOCKED)
+        release.set()
+        await pending_lock
+        return redundant
+
+    assert not asyncio.run(run())
+
+
+def test_unlock_sent_while_lock_awaits_confirmation(fake_hass):
+    async def run():
+        hass = add_vehicle(fake_hass)
+        vehicle = hass.data[DOMAIN][FakeEntry.entry_id][DATA_VEHICLES][VIN]
+        vehicle[DATA_EXPECTED_STATE].expected_states[EXPECTED_STATE_LOCKED] = datetime.now()
+        return is_command_redundant(hass, FakeEntry(), VIN, EXPECTED_STATE_UNLOCKED)
+
+    assert not asyncio.run(run())
+
+
+def test_unlock_sent_when_lock_status_is_unknown(fake_hass):
+    async def run():
+        hass = add_vehicle(fake_hass, "DOOR_LOCKS_STATUS_UNSPECIFIED")
+        return is_command_redundant(hass, FakeEntry(), VIN, EXPECTED_STATE_UNLOCKED)
+
+    assert not asyncio.run(run())
+
+
+class SlowCoordinator:
+    def __init__(self):
+        self.refreshes = 0
+
+    async def async_refresh(self):
+        self.refreshes += 1
+        await asyncio.sleep(0.05)
+
+
+def test_merge_window_starts_when_the_refresh_finished(fake_hass, monkeypatch):
+    monkeypatch.setattr(remote_control_manager, "FORCE_UPDATE_MERGE_SECONDS", 0.02)
+    coordinator = SlowCoordinator()
+    fake_hass.data[DOMAIN] = {
+        FakeEntry.entry_id: {
+            DATA_VEHICLES: {
+                VIN: {
+                    COORDINATORS: {DATA_SHADOW_KEY: coordinator},
+                    DATA_IS_FORCE_UPDATE: set(),
+                    DATA_FORCED_REFRESHES: {},
+                }
+            }
+        }
+    }
+
+    async def run():
+        await force_update_data(fake_hass, FakeEntry(), VIN, (DATA_SHADOW_KEY,))
+        await force_update_data(fake_hass, FakeEntry(), VIN, (DATA_SHADOW_KEY,))
+        merged = coordinator.refreshes
+        await asyncio.sleep(0.03)
+        await force_update_data(fake_hass, FakeEntry(), VIN, (DATA_SHADOW_KEY,))
+        return merged, coordinator.refreshes
+
+    assert asyncio.run(run()) == (1, 2)
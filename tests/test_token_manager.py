@@ -0,0 +1,72 @@
+"""Tests for resolving the user ID sent with the commands."""
+
+import asyncio
+
+from custom_components.lynkco import token_manager
+from custom_components.lynkco.const import STORAGE_USER_IDS_KEY
+
+
+class FakeResponse:
+    status = 200
+
+    def __init__(self, user_id):
+        self._user_id = user_id
+
+    async def json(self):
+        return {"drivers": [{"userId": self._user_id}]}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeClient:
+    """Client whose delegated-driver lookup returns a user ID per VIN."""
+
+    account_id = "account"
+
+    def __init__(self, user_ids):
+        self.user_ids = user_ids
+        self.lookups = []
+
+    def get(self, url, **kwargs):
+        vin = url.split("/vehicle/")[1].split("/")[0]
+        self.lookups.append(vin)
+        return FakeResponse(self.user_ids[vin])
+
+
+def test_user_id_is_resolved_per_vehicle(fake_hass, fake_store, monkeypatch):
+    monkeypatch.setattr(token_manager, "get_token_storage", lambda hass, account_id: fake_store)
+    client = FakeClient({"FIRST": "driver_1", "SECOND": "driver_2"})
+
+    async def run():
+        return [
+            await token_manager.get_user_id(fake_hass, "token", vin, client)
+            for vin in ("FIRST", "SECOND", "FIRST")
+        ]
+
+    assert asyncio.run(run()) == ["driver_1", "driver_2", "driver_1"]
+    assert client.lookups == ["FIRST", "SECOND"]
+    assert fake_store.stored[STORAGE_USER_IDS_KEY] == {
+        "FIRST": "driver_1",
+        "SECOND": "driver_2",
+    }
+
+
+def test_forced_refresh_replaces_the_stored_user_id(fake_hass, fake_store, monkeypatch):
+    monkeypatch.setattr(token_manager, "get_token_storage", lambda hass, account_id: fake_store)
+    fake_store.stored = {STORAGE_USER_IDS_KEY: {"FIRST": "stale_driver"}}
+    client = FakeClient({"FIRST": "driver_1"})
+
+    async def run():
+        return [
+            await token_manager.get_user_id(fake_hass, "token", "FIRST", client),
+            await token_manager.get_user_id(
+                fake_hass, "token", "FIRST", client, force_refresh=True
+            ),
+        ]
+
+    assert asyncio.run(run()) == ["stale_driver", "driver_1"]
+    assert fake_store.stored[STORAGE_USER_IDS_KEY] == {"FIRST": "driver_1"}